@@ -78,24 +78,20 @@ def main():
 
     print(f"Creating {SCHEMA_NAME}.{TABLE_NAME}...")
 
-    # Step 1: Create schema
+    # Single connection for all steps (one handshake instead of three)
     with mysql.connector.connect(**config) as conn:
         with conn.cursor() as cursor:
+            # Step 1: Create schema
             cursor.execute(f"CREATE DATABASE IF NOT EXISTS `{SCHEMA_NAME}` DEFAULT CHARACTER SET utf8")
-        conn.commit()
-    print(f"  Schema '{SCHEMA_NAME}' ready")
+            print(f"  Schema '{SCHEMA_NAME}' ready")
 
-    # Step 2: Create table
-    config["database"] = SCHEMA_NAME
-    with mysql.connector.connect(**config) as conn:
-        with conn.cursor() as cursor:
+            # Step 2: Create table
+            cursor.execute(f"USE `{SCHEMA_NAME}`")
             cursor.execute(CREATE_TABLE_SQL)
-        conn.commit()
-    print(f"  Table '{TABLE_NAME}' created")
+            conn.commit()
+            print(f"  Table '{TABLE_NAME}' created")
 
-    # Step 3: Verify
-    with mysql.connector.connect(**config) as conn:
-        with conn.cursor() as cursor:
+            # Step 3: Verify
             cursor.execute(f"SELECT COUNT(*) FROM information_schema.tables WHERE table_schema = '{SCHEMA_NAME}' AND table_name = '{TABLE_NAME}'")
             if cursor.fetchone()[0] == 1:
                 print("Done.")
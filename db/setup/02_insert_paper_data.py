@@ -1,28 +1,34 @@
 """
 02_insert_paper_data.py
 
-Inserts the delfi paper data from a preprocessed CSV file into the delfi_study.paper
-MySQL table.
+Inserts the delfi paper data from a preprocessed CSV or Parquet file into the
+delfi_study.paper MySQL table.
 
 Usage:
-    python3 db/setup/02_insert_paper_data.py <csv_file_path>
+    python3 db/setup/02_insert_paper_data.py <csv_or_parquet_file_path>
 
 Example:
+    python3 db/setup/02_insert_paper_data.py data/preprocessed/delfi_paper_with_metadata_2026-01-27.parquet
     python3 db/setup/02_insert_paper_data.py data/preprocessed/delfi_paper_with_metadata_2026-01-27.csv
 
 Prerequisites:
     - MySQL server running
     - .env file in project root with DB_HOST, DB_PORT, DB_USER, DB_PASSWORD
     - Paper table created (via 01_create_paper_table.py)
-    - Preprocessed CSV file (from preprocessing/data_preparation.ipynb)
+    - Preprocessed CSV or Parquet file (from preprocessing/data_preparation.ipynb)
 
 Note:
     Schema documentation: db/schema/schema_paper_only_2025-12-29.sql
+    Parquet is the preferred input: it is read column-wise without string
+    parsing and keeps the column dtypes (requires pyarrow). The CSV path is
+    kept for older exports.
 """
 
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
+import numpy as np
 import pandas as pd
 from dotenv import load_dotenv
 import mysql.connector
@@ -45,29 +51,49 @@ COLUMNS = [
 
 
 # Build parameterized INSERT statement
-INSERT_SQL = (
+# (plain INSERT: duplicates are dropped up front in find_duplicates(); a batch
+# with a remaining UNIQUE violation is retried row by row, and an over-long
+# value raises and aborts the load)
+INSERT_PREFIX = (
     f"INSERT INTO `{TABLE_NAME}` "
     f"({', '.join(f'`{col}`' for col in COLUMNS)}) "
-    f"VALUES ({', '.join(['%s'] * len(COLUMNS))})" #%s as placeholder
+    f"VALUES "
 )
+ROW_PLACEHOLDERS = f"({', '.join(['%s'] * len(COLUMNS))})" #%s as placeholder
+INSERT_SQL = INSERT_PREFIX + ROW_PLACEHOLDERS
 
 # Columns that are NOT NULL in the MySQL schema
 NOT_NULL_COLUMNS = ['title', 'authors', 'year', 'text', 'filename']
 
+# UNIQUE indexes of the MySQL schema (doi_UNIQUE, title_UNIQUE, unique_year_filename)
+UNIQUE_KEYS = [('doi',), ('title',), ('year', 'filename')]
+
+# Explicit read_csv dtypes: text/identifier columns stay strings (no numeric
+# inference on e.g. isbn or conference_date), page numbers are nullable ints.
+# 'year' is inferred and cast after the NOT NULL check.
+CSV_DTYPES = {
+    col: str for col in COLUMNS if col not in ('year', 'start_page', 'end_page')
+} | {'start_page': 'Int64', 'end_page': 'Int64'}
+
 
 def load_and_validate_csv(csv_path: str) -> pd.DataFrame:
     """
-    Load and validate a preprocessed CSV file for database insertion.
+    Load and validate a preprocessed CSV or Parquet file for database insertion.
 
     Checks:
         1. File exists and is readable
         2. All required columns are present
         3. NOT NULL columns contain no missing values
-        4. Data types are converted (year -> int, start_page/end_page -> int or None)
-        5. NaN values are replaced with None for MySQL compatibility
+        4. Data types are converted (year -> int, start_page/end_page -> nullable Int64)
+
+    The format is chosen by file suffix (.parquet, otherwise CSV). Only the
+    columns in COLUMNS are read; any extra columns are skipped.
+
+    Missing values stay as NaN/NA here; they are converted to None per cell
+    in insert_papers() to avoid an object-dtype copy of the frame.
 
     Args:
-        csv_path: Path to the preprocessed CSV file.
+        csv_path: Path to the preprocessed CSV or Parquet file.
 
     Returns:
         Validated pandas DataFrame ready for insertion.
@@ -77,17 +103,24 @@ def load_and_validate_csv(csv_path: str) -> pd.DataFrame:
     """
     path = Path(csv_path)
     if not path.exists():
-        print(f"Error: CSV file not found: {path}")
+        print(f"Error: Input file not found: {path}")
         sys.exit(1)
 
-    print(f"Loading CSV: {path}")
-    df = pd.read_csv(path)
+    if path.suffix.lower() == '.parquet':
+        import pyarrow.parquet as pq  # only needed for Parquet input
+
+        print(f"Loading Parquet: {path}")
+        available = set(pq.read_schema(path).names)
+        df = pd.read_parquet(path, columns=[col for col in COLUMNS if col in available])
+    else:
+        print(f"Loading CSV: {path}")
+        df = pd.read_csv(path, usecols=lambda col: col in COLUMNS, dtype=CSV_DTYPES)
     print(f"  Loaded {len(df)} rows, {len(df.columns)} columns")
 
     # Check that all required columns are present
     missing_cols = set(COLUMNS) - set(df.columns)
     if missing_cols:
-        print(f"Error: Missing columns in CSV: {missing_cols}")
+        print(f"Error: Missing columns in {path.name}: {missing_cols}")
         sys.exit(1)
 
     # Check NOT NULL columns for missing values
@@ -97,65 +130,213 @@ def load_and_validate_csv(csv_path: str) -> pd.DataFrame:
             print(f"Error: NOT NULL column '{col}' has {null_count} missing values")
             sys.exit(1)
 
-    # Convert data types
+    # Convert data types (page columns are already Int64 when read from CSV)
     df['year'] = df['year'].astype(int)
-    df['start_page'] = df['start_page'].apply(
-        lambda x: int(x) if pd.notna(x) else None
-    )
-    df['end_page'] = df['end_page'].apply(
-        lambda x: int(x) if pd.notna(x) else None
-    )
-
-    # Replace NaN with None for MySQL compatibility
-    # (CSV round-trip converts None back to NaN, so this is needed again)
-    df = df.where(pd.notnull(df), None)
+    df['start_page'] = df['start_page'].astype('Int64')
+    df['end_page'] = df['end_page'].astype('Int64')
 
     print("  Validation passed")
     return df
 
 
-BATCH_SIZE = 50
+# Rows per multi-row INSERT statement. Each paper carries its full text, so
+# keep BATCH_SIZE * (largest row) well below the server's max_allowed_packet.
+BATCH_SIZE = 200
+
+
+def _to_sql_value(value):
+    """
+    Convert a DataFrame cell to a value mysql-connector can bind.
+
+    Missing values (NaN, pd.NA) become None and numpy scalars (e.g. from the
+    nullable Int64 page columns) become plain Python numbers.
+    """
+    if pd.isna(value):
+        return None
+    return value.item() if isinstance(value, np.generic) else value
+
+
+@lru_cache(maxsize=None)
+def _build_insert_sql(n_rows: int) -> str:
+    """
+    Build a multi-row INSERT statement with placeholders for n_rows rows.
+
+    Cached so that repeated batch sizes return the identical string object,
+    which the prepared cursor checks (by identity) to skip re-preparing.
+
+    Args:
+        n_rows: Number of value tuples in the VALUES clause.
+
+    Returns:
+        SQL string of the form INSERT INTO ... VALUES (%s, ...), (%s, ...), ...
+    """
+    return INSERT_PREFIX + ', '.join([ROW_PLACEHOLDERS] * n_rows)
+
+
+def _normalize_key_value(value):
+    """
+    Normalize a UNIQUE key value for the client-side duplicate check
+    (lowercase, trailing spaces ignored). Missing values return None.
+
+    This approximates the utf8 *_ci collation conservatively: lower() (not
+    casefold(), which maps 'ß' to 'ss') never makes two values equal that
+    the collation keeps apart. Collation matches it misses (e.g. accents)
+    are rejected by the server and skipped by insert_papers().
+    """
+    if value is None or pd.isna(value):
+        return None
+    if isinstance(value, str):
+        return value.lower().rstrip(' ')
+    return int(value)
+
+
+def _insert_rows_individually(cursor, rows: list, row_ids: list) -> list:
+    """
+    Insert rows one at a time, skipping those that violate a UNIQUE constraint.
+
+    Used for a batch the server rejected with an IntegrityError: InnoDB rolls
+    back the failed multi-row statement as a whole, so retrying row by row
+    isolates the duplicates. Other errors (e.g. DataError) propagate.
+
+    Args:
+        cursor: Open MySQL cursor.
+        rows: List of value tuples in COLUMNS order.
+        row_ids: DataFrame index labels of the rows (for reporting).
+
+    Returns:
+        List of (row_index, title, error_message) for the skipped rows.
+    """
+    skipped_details = []
+    for row_id, row in zip(row_ids, rows):
+        try:
+            cursor.execute(_build_insert_sql(1), list(row))
+        except mysql.connector.IntegrityError as e:
+            skipped_details.append((row_id, row[COLUMNS.index('title')], str(e)))
+    return skipped_details
+
+
+def find_duplicates(df: pd.DataFrame, conn) -> list:
+    """
+    Find rows that would violate one of the table's UNIQUE constraints.
 
+    A row is a duplicate if its doi, title, or year+filename matches a row
+    already in the table or an earlier row of the CSV (the first occurrence
+    is kept, as it would be by sequential inserts). NULL values never
+    collide, matching MySQL's UNIQUE index semantics.
 
-def insert_papers(df: pd.DataFrame, config: dict) -> tuple[int, int, list]:
+    Args:
+        df: Validated DataFrame from load_and_validate_csv().
+        conn: Open MySQL connection to the delfi_study database.
+
+    Returns:
+        List of (row_index, title, reason) for the duplicate rows.
+    """
+    key_columns = [col for key in UNIQUE_KEYS for col in key]
+    seen = {key: {} for key in UNIQUE_KEYS}  # normalized value -> origin
+
+    def key_values(row: dict, key: tuple):
+        values = tuple(_normalize_key_value(row[col]) for col in key)
+        return None if None in values else values
+
+    # Keys of rows already in the table
+    with conn.cursor() as cursor:
+        cursor.execute(
+            f"SELECT {', '.join(f'`{col}`' for col in key_columns)} FROM `{TABLE_NAME}`"
+        )
+        for values in cursor.fetchall():
+            row = dict(zip(key_columns, values))
+            for key in UNIQUE_KEYS:
+                kv = key_values(row, key)
+                if kv is not None:
+                    seen[key].setdefault(kv, 'existing row in table')
+
+    duplicates = []
+    for idx, values in zip(df.index, df[key_columns].itertuples(index=False, name=None)):
+        row = dict(zip(key_columns, values))
+        row_keys = {key: key_values(row, key) for key in UNIQUE_KEYS}
+        clash = next(
+            (key for key, kv in row_keys.items() if kv is not None and kv in seen[key]),
+            None,
+        )
+        if clash is not None:
+            duplicates.append((
+                idx, row['title'],
+                f"Duplicate {'+'.join(clash)} (same as {seen[clash][row_keys[clash]]})"
+            ))
+            continue
+        for key, kv in row_keys.items():
+            if kv is not None:
+                seen[key][kv] = f"CSV row {idx}"
+
+    return duplicates
+
+
+def insert_papers(df: pd.DataFrame, conn) -> tuple[int, int, list]:
     """
     Insert paper records into the MySQL paper table.
 
-    Inserts rows one at a time and commits in batches. Rows that violate
-    UNIQUE constraints (duplicate doi, title, or year+filename) are skipped
-    and reported.
+    Rows that would violate a UNIQUE constraint (duplicate doi, title, or
+    year+filename) are detected up front with find_duplicates(), skipped and
+    reported. The remaining rows are sent BATCH_SIZE at a time as multi-row
+    INSERT statements (one round trip per batch). All batches run in a
+    single transaction that is committed once at the end. If the server still
+    rejects a batch as a duplicate (one the client-side check missed, e.g.
+    accent-insensitive matches), that batch is retried row by row and the
+    rejected rows are skipped and reported. Any other rejection (e.g. a value
+    too long for its column) rolls back the transaction and exits, leaving
+    the table untouched.
 
     Args:
         df: Validated DataFrame from load_and_validate_csv().
-        config: MySQL connection config dict (with 'database' key set).
+        conn: Open MySQL connection to the delfi_study database.
 
     Returns:
         Tuple of (inserted_count, skipped_count, skipped_details).
         skipped_details is a list of (row_index, title, error_message).
+
+    Raises:
+        SystemExit: If the server rejects a batch with a DataError.
     """
     inserted = 0
-    skipped = 0
-    skipped_details = []
-
-    with mysql.connector.connect(**config) as conn:
-        with conn.cursor() as cursor:
-            for i, row in df.iterrows():
-                values = tuple(row[col] for col in COLUMNS)
+    skipped_details = find_duplicates(df, conn)
+    skipped = len(skipped_details)
+    to_insert = df.drop(index=[idx for idx, _, _ in skipped_details])
+
+    # Server-side prepared statement: every full batch reuses the same
+    # multi-row INSERT, so it is parsed once and only re-executed with new
+    # parameters (the cursor re-prepares only when the SQL text changes)
+    with conn.cursor(prepared=True) as cursor:
+        for start in range(0, len(to_insert), BATCH_SIZE):
+            # Plain tuples in INSERT column order; NaN/NA -> None per cell
+            # (CSV round-trip converts None back to NaN)
+            chunk = to_insert.iloc[start:start + BATCH_SIZE][COLUMNS]
+            batch = [
+                tuple(map(_to_sql_value, row))
+                for row in chunk.itertuples(index=False, name=None)
+            ]
+            try:
                 try:
-                    cursor.execute(INSERT_SQL, values)
-                    inserted += 1
-                except mysql.connector.IntegrityError as e:
-                    skipped += 1
-                    skipped_details.append((i, row['title'], str(e)))
-
-                # Commit in batches
-                if (inserted + skipped) % BATCH_SIZE == 0:
-                    conn.commit()
-                    print(f"  Progress: {inserted + skipped}/{len(df)} "
-                          f"(inserted: {inserted}, skipped: {skipped})")
-
-            # Final commit for remaining rows
-            conn.commit()
+                    cursor.execute(_build_insert_sql(len(batch)),
+                                   [value for row in batch for value in row])
+                    batch_skipped = []
+                except mysql.connector.IntegrityError:
+                    batch_skipped = _insert_rows_individually(
+                        cursor, batch, list(chunk.index)
+                    )
+            except mysql.connector.DataError as e:
+                conn.rollback()
+                print(f"Error: Batch with rows {chunk.index[0]}-{chunk.index[-1]} "
+                      f"was rejected, nothing was inserted: {e}")
+                sys.exit(1)
+
+            inserted += len(batch) - len(batch_skipped)
+            skipped += len(batch_skipped)
+            skipped_details.extend(batch_skipped)
+            print(f"  Progress: {inserted + skipped}/{len(df)} "
+                  f"(inserted: {inserted}, skipped: {skipped})")
+
+    # Single commit for the whole load (one redo log flush instead of one per batch)
+    conn.commit()
 
     print(f"\nInsertion complete: {inserted} inserted, {skipped} skipped "
           f"out of {len(df)} total")
@@ -168,43 +349,43 @@ def insert_papers(df: pd.DataFrame, config: dict) -> tuple[int, int, list]:
     return inserted, skipped, skipped_details
 
 
-def verify_insertion(config: dict, expected_count: int):
+def verify_insertion(conn, expected_count: int):
     """
     Verify the insertion by checking the row count and printing sample rows.
 
     Args:
-        config: MySQL connection config dict (with 'database' key set).
+        conn: Open MySQL connection to the delfi_study database.
         expected_count: Number of rows expected in the table. (will use the number of successfully inserted rows returned by insert_papers())
     """
-    with mysql.connector.connect(**config) as conn:
-        with conn.cursor() as cursor:
-            # Row count
-            cursor.execute(f"SELECT COUNT(*) FROM `{TABLE_NAME}`")
-            actual_count = cursor.fetchone()[0]
-            print(f"\nVerification:")
-            print(f"  Rows in table: {actual_count}")
-            print(f"  Expected:      {expected_count}")
-
-            if actual_count == expected_count:
-                print("  Status: OK")
-            else:
-                print(f"  Status: MISMATCH (difference: {actual_count - expected_count})")
-
-            # Year distribution
-            cursor.execute(
-                f"SELECT `year`, COUNT(*) AS cnt FROM `{TABLE_NAME}` "
-                f"GROUP BY `year` ORDER BY `year`"
-            )
-            rows = cursor.fetchall()
-            print(f"\n  Papers per year ({len(rows)} years):")
-            for year, cnt in rows:
-                print(f"    {year}: {cnt}")
+    with conn.cursor() as cursor:
+        # Year distribution and total in one query (ROLLUP row has year NULL)
+        cursor.execute(
+            f"SELECT `year`, COUNT(*) AS cnt FROM `{TABLE_NAME}` "
+            f"GROUP BY `year` WITH ROLLUP"
+        )
+        rows = cursor.fetchall()
+
+    year_rows = sorted(row for row in rows if row[0] is not None)
+    actual_count = next((cnt for year, cnt in rows if year is None), 0)
+
+    print(f"\nVerification:")
+    print(f"  Rows in table: {actual_count}")
+    print(f"  Expected:      {expected_count}")
+
+    if actual_count == expected_count:
+        print("  Status: OK")
+    else:
+        print(f"  Status: MISMATCH (difference: {actual_count - expected_count})")
+
+    print(f"\n  Papers per year ({len(year_rows)} years):")
+    for year, cnt in year_rows:
+        print(f"    {year}: {cnt}")
 
 
 def main():
     # Check CLI argument
     if len(sys.argv) != 2: #if user passed too few or too many arguments to the python script
-        print("Usage: python3 db/setup/02_insert_paper_data.py <csv_file_path>")
+        print("Usage: python3 db/setup/02_insert_paper_data.py <csv_or_parquet_file_path>")
         sys.exit(1) #terminates the script immediately 
 
     csv_path = sys.argv[1] #sys.argv is a list that contains the command-line arguments passed to the python script (0-indexed)
@@ -222,17 +403,22 @@ def main():
         "user": os.getenv("DB_USER"),
         "password": os.getenv("DB_PASSWORD"),
         "database": SCHEMA_NAME,
+        # zlib-compress the protocol: the text/abstract/references payloads
+        # are large natural-language strings (matters for a remote DB_HOST)
+        "compress": True,
     }
 
     # Step 1: Load and validate CSV
     df = load_and_validate_csv(csv_path)
 
-    # Step 2: Insert papers
-    print(f"\nInserting {len(df)} papers into {SCHEMA_NAME}.{TABLE_NAME}...")
-    inserted, skipped, _ = insert_papers(df, config)
+    # Steps 2 and 3 share one connection
+    with mysql.connector.connect(**config) as conn:
+        # Step 2: Insert papers
+        print(f"\nInserting {len(df)} papers into {SCHEMA_NAME}.{TABLE_NAME}...")
+        inserted, skipped, _ = insert_papers(df, conn)
 
-    # Step 3: Verify
-    verify_insertion(config, expected_count=inserted)
+        # Step 3: Verify
+        verify_insertion(conn, expected_count=inserted)
 
     print("\nDone.")
 
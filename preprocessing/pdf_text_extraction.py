@@ -13,54 +13,323 @@ Usage:
     )
 """
 
+import os
 import pymupdf
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 
-def extract_text_from_pdf(pdf_path: Path | str, min_pages: int | None = None) -> str | None:
+# --- Compiled regex patterns for extract_main_content() / extract_references() ---
+# Compiled once at import time; the functions below only call .search()/.finditer().
+
+# Priority 1: Number + relevant Keywords combination (e.g.,Introduction/Einleitung)
+# One alternation instead of three patterns; each alternative is its own group, in priority order
+# (resolved by _search_by_priority below)
+_RE_PRIORITY_1 = re.compile(
+    r'(^\s*1\s*\n\s*(?:Introduction|Einleitung|Einführung|Background|Motivation|Hintergrund))'  # e.g., " 1\nIntroduction" or "1\nIntroduction"
+    r'|(^\s*1\.?\s+(?:Introduction|Einleitung|Einführung|Background|Motivation|Hintergrund))'    # e.g., " 1 Introduction" or "1. Introduction"
+    r'|(^\s*1:\s*(?:Introduction|Einleitung|Einführung|Background|Motivation|Hintergrund))',     # e.g., " 1: Introduction" or "1: Introduction"
+    re.MULTILINE | re.IGNORECASE,
+)
+
+# Priority 2: Keywords only (standalone line), same group-per-alternative layout as Priority 1
+_RE_PRIORITY_2 = re.compile(
+    r'(^\s*(?:Introduction|Einleitung|Einführung|Problemstellung)\s*$)'  # Allow leading/trailing whitespace ("Problemstellung appeared in one empirical case")
+    r'|(^\s*(?:Introduction|Einleitung|Einführung):\s*.+$)'  # e.g., "Introduction: subtitle"
+    r'|(^\s*(?:Introduction|Einleitung|Einführung)[\s–—-]+.{1,50}$)',  # e.g., "Einleitung – Die chinesisch-deutsche..." (handles em-dash, en-dash, hyphen); Added a length limit to match intro headers but no text in the main body
+    re.MULTILINE | re.IGNORECASE,
+)
+
+# "Abstract:" or German equivalent "Zusammenfassung:" (Priorities 2 and 3)
+_RE_ABSTRACT = re.compile(r'^(?:Abstract|Zusammenfassung|Kurzfassung|Summary|Résumé):\s*', re.MULTILINE | re.IGNORECASE)
+
+# "Keywords:" label (Priority 3) and full "Keywords: ..." line (Priority 4), English or German variants
+_RE_KEYWORDS_LABEL = re.compile(r'^(?:Keywords|Key\s+words|Schlüsselwörter|Schlagwörter|Keyphrases|Key\s+phrases|Index\s+Terms|Suchbegriffe|Stichwörter|Indexbegriffe):\s*', re.MULTILINE | re.IGNORECASE)
+_RE_KEYWORDS_LINE = re.compile(r'^(?:Keywords|Key\s+words|Schlüsselwörter|Schlagwörter|Keyphrases|Key\s+phrases|Index\s+Terms|Suchbegriffe|Stichwörter|Indexbegriffe):\s*.+$', re.MULTILINE | re.IGNORECASE)
+
+# Numbered section heading (Priorities 3, 4 and 5)
+# e.g., " 1   Two Traditions" or "1. Title" (same line), " 1\nTwo Traditions" (separate line)
+# \s+ spans the newline, so one pattern covers both the same-line and the separate-line form
+_RE_NUMBERED_HEADING = re.compile(r'^\s*1\.?\s+[A-Za-zÄÖÜäöü][^\n]{0,80}$', re.MULTILINE)
+
+# Priority 3: blank line followed by capital letter (negative lookahead to skip Keywords variants)
+_RE_NEXT_PARAGRAPH = re.compile(r'\n\s*\n+\s*(?!Keywords|Key\s+words|Schlüsselwörter|Schlagwörter|Keyphrases|Key\s+phrases|Index\s+Terms|Suchbegriffe|Stichwörter|Indexbegriffe)([A-ZÄÖÜ])', re.IGNORECASE)
+# Priority 3: period + newline + capital
+_RE_PERIOD_NEWLINE_CAPITAL = re.compile(r'\.\n([A-ZÄÖÜ])')
+
+# Priority 4: first line starting uppercase, unnumbered header, next non-empty uppercase line
+_RE_UPPERCASE_LINE_START = re.compile(r'^\s*[A-ZÄÖÜ]', re.MULTILINE)
+_RE_UNNUMBERED_HEADER = re.compile(r'^\s*[A-Za-zÄÖÜäöü][^\n]{0,80}$', re.MULTILINE)
+_RE_UPPERCASE_LINE = re.compile(r'^\s*[A-ZÄÖÜ][^\n]+$', re.MULTILINE)
+
+# References heading: optional section number (separate/same line) + keyword + optional footnote
+# Examples: "Literatur", "5\nLiteratur", "5  Literatur", "5. Literatur", "Literatur1", "Bibliografie"
+_RE_REFERENCES_HEADING = re.compile(
+    r'^\s*(?:\d+\s*\n\s*|\d+\.?\s+)?(References|Literaturverzeichnis|Literaturverhzeichnis|Literatur|Bibliography|Bibliografie|Literature|Referenzen|Quellenverzeichnis|Quellen|Reference\s+List|Literaturverzeichnis\s+und\s+Internetquellen)\d*\s*$',
+    re.MULTILINE | re.IGNORECASE,
+)
+
+# Reference entry validation: Support multiple citation styles
+# Style 1: DeLFI-style [BBS01], [HKN01], [Ka93]
+# Style 2: Numeric [1], [2], [123]
+# Style 3: Author-year without brackets: Bruner, J.S. (1961)
+# Style 4: Author-year with brackets: [Adler 2006], [Weber-Wulff 2002], [ISO 2006]
+# One alternation, so a candidate window is scanned once instead of once per style
+_RE_REFERENCE_ENTRY = re.compile(
+    r'\s*\[(?:[A-Za-z]{2,4}|[A-Z][a-z]{1,2})\d{2}\]'  # DeLFI-style
+    r'|^\s*\[\d{1,3}\]'  # Numeric style
+    r'|^[A-ZÄÖÜ][a-zäöüß]+,\s+[A-Z].*?\(\d{4}\)'  # Author-year style
+    r'|\s*\[[A-Z][A-Za-z-]+\s+\d{4}\]',  # Author-year bracketed style
+    re.MULTILINE,
+)
+
+# Trailing line of the references section (one group per pattern, in priority order)
+_RE_TRAILING_LINE = re.compile(
+    r'(\n\d{1,4}\s*$)'  # Pattern A: Just page number (e.g., "449", "22")
+    r'|(\n\d{1,4}\s+[A-ZÄÖÜ][a-zäöüß]+.*$)'  # Pattern B: Page number + authors (e.g., "208 Alexander Aumann et al.")
+    r'|(\n[A-ZÄÖÜ].+\s+\d{1,4}\s*$)'  # Pattern C: Title + page number (e.g., "The interplay... 21")
+)
+
+# --- Compiled regex patterns for _is_corrupted_text() and title/author postprocessing ---
+_RE_LETTER_DIGIT_TRANSITION = re.compile(r'[a-zA-ZäöüÄÖÜß]\d|\d[a-zA-ZäöüÄÖÜß]')  # e.g., "E4M", "pM1", "c4"
+_RE_WHITESPACE_RUN = re.compile(r'\s+')
+_RE_AFFILIATION_MARKERS = re.compile(r'[\d*†‡§¶כ¹²³⁴⁵⁶⁷⁸⁹⁰]+')  # digits and special symbols (*, †, ‡, §, ¶, כ)
+_RE_TRAILING_COMMA = re.compile(r',\s*$')
+_RE_TRAILING_UND = re.compile(r'\s+und\s*$')
+
+# --- Compiled regex patterns for extract_title_from_pdf() / _extract_title_lines_raw() ---
+# Header lines to skip (lni262, lni273, lni247 format), fused into one alternation:
+# "(Hrsg.)", "Lecture Notes in Informatics (LNI)", "Gesellschaft für Informatik, Bonn 2016",
+# or a line that is just a page number (1-3 digits alone; lines are stripped before matching)
+_RE_TITLE_HEADER_LINE = re.compile(
+    r'\(Hrsg\.\)|Lecture Notes in Informatics|Gesellschaft für Informatik|^\d{1,3}$',
+    re.IGNORECASE,
+)
+_RE_NAME_WITH_MARKER = re.compile(r'[A-ZÄÖÜ][a-zäöüß]+[\d*†‡§¶]')  # Name followed by affiliation marker (e.g., "Strickroth1")
+
+# Author patterns (German academic papers), shared with extract_authors_from_pdf()
+# Character classes for international names:
+# - German: äöüÄÖÜß
+# - Spanish/Portuguese: áéíóúÁÉÍÓÚñÑãõÃÕ
+# - French: àèéêëìîïôùûçÀÈÉÊËÌÎÏÔÙÛÇ
+# - Eastern European: ăășțĂȘȚčšžČŠŽđĐłŁńŃśŚźŹżŻąĄęĘćĆ
+# - Ill-formed diacritics: ¨´` (from PDF extraction errors)
+_AUTHOR_UPPER = r'[A-ZÄÖÜÁÉÍÓÚÀÈÌÒÙÂÊÎÔÛÃÕÑĂȘȚČŠŽĐŁŃŚŹŻĄĘĆ]'
+_AUTHOR_LOWER = r'[a-zäöüßáéíóúàèìòùâêîôûãõñășțčšžđłńśźżąęć¨´`]'
+
+# Firstname pattern: supports hyphenated names
+# Examples: "Annette", "Chiu-Li", "Marie-Claire", "Jean-Paul"
+_AUTHOR_FIRSTNAME = rf'{_AUTHOR_UPPER}{_AUTHOR_LOWER}+(?:-{_AUTHOR_UPPER}{_AUTHOR_LOWER}+)*'
+
+# Middle name: optional middle initial or full middle name (with optional hyphens)
+# Examples: "G. ", "A. ", "H. " (initials)
+#           "Michael ", "Alexander ", "Marie-Claire " (full names, possibly hyphenated)
+_AUTHOR_MIDDLE_NAME = rf'(?:(?:[A-Z]\.?\s+)|(?:{_AUTHOR_UPPER}{_AUTHOR_LOWER}+(?:-{_AUTHOR_UPPER}{_AUTHOR_LOWER}+)*\s+))?'
+
+# Pattern 1: Multiple names with commas
+# Examples: "Dominik Niehus, Patrik Erren"
+#           "Ian G. Kennedy1, Paul H. Vossen2" (with middle initials)
+#           "Kai Michael Höver, Guido Rößling" (with full middle names)
+#           "Erika Ábrahám, Philipp Brauner" (with accented characters)
+#           "Annette Baumann1, Chiu-Li Tseng2" (with hyphenated names)
+# Format: Firstname [MiddleName] Lastname[markers], ...
+_RE_AUTHOR_COMMAS = re.compile(rf'^{_AUTHOR_FIRSTNAME}\s+{_AUTHOR_MIDDLE_NAME}{_AUTHOR_FIRSTNAME}[\s\d*†‡§¶כ]*,.*{_AUTHOR_FIRSTNAME}')
+
+# Pattern 2: Names with "und" or "&" (German/English "and")
+# Examples: "Sven Manske2 und H. Ulrich Hoppe2"
+#           "Peter A. Henning und Klaus Müller" (with middle initials/names)
+#           "Sven Strickroth1 & Niels Pinkwart2" (with ampersand)
+#           "Ahmad Fatoum2und Jörg Abke1" (PDF extraction error: missing space)
+#           "Annette Baumann1 und Chiu-Li Tseng2" (with hyphenated names)
+# Strategy: Look for "und" or "&" pattern, then validate with affiliation markers
+# Allow digit before "und" to handle PDF extraction errors (e.g., "2und" instead of "2 und")
+_RE_AUTHOR_UND = re.compile(rf'(?:[\s\d]und\s|\s&\s){_AUTHOR_FIRSTNAME}\s+{_AUTHOR_MIDDLE_NAME}{_AUTHOR_FIRSTNAME}')
+# Validation for Pattern 2: line starts with a name (e.g., "Sven Strickroth1 & ...")
+_RE_AUTHOR_NAME_START = re.compile(rf'^{_AUTHOR_UPPER}{_AUTHOR_LOWER}+\s+{_AUTHOR_MIDDLE_NAME}{_AUTHOR_UPPER}{_AUTHOR_LOWER}+')
+
+# Pattern 3: Single author
+# Examples: "Klaus Wannemacher", "Andrea Kienle", "Chiu-Li Tseng"
+# Format: Firstname [MiddleName] Lastname[markers] (end of line)
+_RE_AUTHOR_SINGLE = re.compile(rf'^{_AUTHOR_FIRSTNAME}\s+{_AUTHOR_MIDDLE_NAME}{_AUTHOR_FIRSTNAME}[\s\d*†‡§¶כ]*$')
+
+# Any "Firstname [MiddleName] Lastname" in a line (extract_authors_from_pdf: e-mail lines)
+_RE_AUTHOR_NAME = re.compile(rf'{_AUTHOR_FIRSTNAME}\s+{_AUTHOR_MIDDLE_NAME}{_AUTHOR_FIRSTNAME}')
+
+# Institution keywords to distinguish institution names from author names
+# (e.g., "Hochschule Pforzheim" vs "Klaus Wannemacher"); searched in the lowercased line,
+# one alternation instead of one substring test per keyword
+_RE_TITLE_INSTITUTION = re.compile('|'.join(map(re.escape, [
+    'hochschule', 'universität', 'institut', 'fakultät',
+    'university', 'institute', 'faculty', 'department',
+    'fachbereich', 'lehrstuhl', 'fraunhofer', 'school', 'college'
+])))
+
+# Institution keywords that end the author block (extract_authors_from_pdf);
+# searched in the lowercased line after _normalize_diacritics()
+_RE_AUTHOR_INSTITUTION = re.compile('|'.join(map(re.escape, [
+    # German
+    'lehrstuhl', 'professur', 'lehr- und forschungsgebiet', 'lehrgebiet',
+    'lehr- und forschungsgruppe', 'arbeitsgruppe', 'arbeitsbereich',
+    'fachgruppe', 'fachbereich', 'zentrum', 'zentrum für',
+    'kompetenzzentrum', 'kompetenz-center', 'e-learning center',
+    'universität', 'hochschule', 'institut', 'fakultät', 'abteilung',
+    'fernuniversität', 'donau-universität', 'oberstufenzentrum',
+    'multimedia', 'lab für informatik', 'beuth hochschule', 'fachgebiet',
+    'tu dortmund', 'lufg informatik', 'informatik und angewandte kognitionswissenschaft',
+    'gewerblich technisches', 'fg medienproduktion', 'dfg-graduiertenkolleg „qualitätsverbesserung im e-learning',
+    # English
+    'university', 'institute', 'faculty', 'department', 'college',
+    'school', 'laboratory', 'lab', 'center', 'center for', 'fraunhofer', 'research group'
+])))
+
+
+def _search_by_priority(pattern: re.Pattern, text: str, pos: int = 0, endpos: int | None = None) -> re.Match | None:
+    """
+    Search a fused alternation regex while keeping the priority order of its alternatives.
+
+    Each top-level alternative of `pattern` must be wrapped in exactly one capturing group
+    (group 1 = highest priority) and contain no other capturing groups. The result equals
+    searching the alternatives one by one and returning the first one that matches, but the
+    text is scanned only once.
+
+    Args:
+        pattern: Compiled alternation regex
+        text: Text to search
+        pos: Start index of the search (as in re.Pattern.search)
+        endpos: End index of the search (default: end of text)
+
+    Returns:
+        Earliest match of the highest-priority alternative that matches, or None
+    """
+    if endpos is None:
+        endpos = len(text)
+    best = None
+    match = pattern.search(text, pos, endpos)
+    while match:
+        if best is None or match.lastindex < best.lastindex:
+            best = match
+            if best.lastindex == 1:
+                break
+        match = pattern.search(text, match.start() + 1, endpos)
+    return best
+
+
+def _heading_scan_start(text: str, min_position: int) -> int:
+    """
+    Find where to start scanning for reference headings at or after `min_position`.
+
+    Steps back to just after the last character that no heading match can contain
+    (anything other than whitespace, letters, digits, '.' and '_'). A full-text
+    finditer() cannot have a match spanning that character, so scanning from there
+    yields the same matches at or after `min_position` while skipping the text before it.
+
+    Args:
+        text: Full text extracted from PDF
+        min_position: First position a heading may start at
+
+    Returns:
+        Position to pass as `pos` to _RE_REFERENCES_HEADING.finditer()
+    """
+    pos = min_position
+    while pos > 0:
+        c = text[pos - 1]
+        if not (c.isspace() or c.isalnum() or c in '._'):
+            break
+        pos -= 1
+    return pos
+
+
+def extract_text_from_pdf(pdf_path: Path | str | pymupdf.Document, min_pages: int | None = None, stop_if_corrupted: bool = False) -> str | None:
     """
     Extract raw text from PDF using PyMuPDF.
 
     Args:
-        pdf_path: Path to the PDF file
+        pdf_path: Path to the PDF file, or an already opened pymupdf.Document
+                  (reused as is and left open)
         min_pages: Minimum required pages. If set and PDF has fewer pages,
                    extraction is skipped and None is returned.
                    Default None means no filtering (extract all PDFs).
+        stop_if_corrupted: If True, run the corruption check as soon as the first 2000
+                   characters are extracted and stop reading pages if it fails. The returned
+                   text is then incomplete, but its first 2000 characters (all that
+                   _is_corrupted_text, title and author extraction look at) are unchanged.
 
     Returns:
         Raw text content from all pages concatenated, or None if page requirement not met.
     """
-    doc = pymupdf.open(pdf_path)
+    if isinstance(pdf_path, pymupdf.Document):
+        return _extract_text_from_doc(pdf_path, min_pages, stop_if_corrupted)
 
+    # Context manager closes the document even if a page fails to decode
+    with pymupdf.open(pdf_path) as doc:
+        return _extract_text_from_doc(doc, min_pages, stop_if_corrupted)
+
+
+def _extract_text_from_doc(doc: pymupdf.Document, min_pages: int | None, stop_if_corrupted: bool = False) -> str | None:
+    """Extract text from an open document (shared by the path and Document inputs)."""
     # Check page count FIRST - skip extraction if below threshold
     if min_pages is not None and len(doc) < min_pages:
-        doc.close()
         return None
-    
-    text = ""
-    for page in doc:
-        text += page.get_text()
-    doc.close()
-    return text
 
-def get_page_count(pdf_path: Path | str) -> int:
+    # Collect pages and join once (repeated += copies the growing string)
+    pages = []
+    extracted_chars = 0
+    check_pending = stop_if_corrupted
+    for page in doc:
+        pages.append(page.get_text())
+
+        # Corruption check needs only the first 2000 chars (sample_size of _is_corrupted_text)
+        if check_pending:
+            extracted_chars += len(pages[-1])
+            if extracted_chars >= 2000:
+                check_pending = False
+                text = "".join(pages)
+                if _is_corrupted_text(text):
+                    return text  # Garbled PDF: skip decoding the remaining pages
+    return "".join(pages)
+
+def get_page_count(pdf_path: Path | str | pymupdf.Document) -> int:
     """
     Get page count from PDF without performing text extraction.
 
     Useful for filtering or statistics when you don't need the actual text.
+    If the text is needed as well, extract_all() avoids opening the file twice.
 
     Args:
-        pdf_path: Path to the PDF file
+        pdf_path: Path to the PDF file, or an already opened pymupdf.Document
 
     Returns:
         Number of pages in the PDF
     """
-    doc = pymupdf.open(pdf_path)
-    count = len(doc)
-    doc.close()
-    return count
+    if isinstance(pdf_path, pymupdf.Document):
+        return len(pdf_path)
+
+    with pymupdf.open(pdf_path) as doc:
+        return len(doc)
+
+
+def extract_all(pdf_path: Path | str | pymupdf.Document, min_pages: int | None = None) -> dict:
+    """
+    Extract raw text and page count from a PDF with a single open.
+
+    Calling get_page_count() and then extract_text_from_pdf() opens (and parses)
+    the file twice; use this when both values are needed.
+
+    Args:
+        pdf_path: Path to the PDF file, or an already opened pymupdf.Document
+        min_pages: Minimum required pages (see extract_text_from_pdf)
+
+    Returns:
+        Dictionary with 'text' (None if page requirement not met) and 'pages'
+    """
+    if isinstance(pdf_path, pymupdf.Document):
+        return {'text': _extract_text_from_doc(pdf_path, min_pages), 'pages': len(pdf_path)}
+
+    with pymupdf.open(pdf_path) as doc:
+        return {'text': _extract_text_from_doc(doc, min_pages), 'pages': len(doc)}
 
 
 def _normalize_diacritics(text: str) -> str:
@@ -91,6 +360,10 @@ def _normalize_diacritics(text: str) -> str:
     return text
 
 
+# Translation table for _is_corrupted_text(): deletes control characters except \t, \n, \r
+_CONTROL_CHARS_DELETE = dict.fromkeys(c for c in range(32) if chr(c) not in '\n\r\t')
+
+
 def _is_corrupted_text(text: str, sample_size: int = 2000) -> bool:
     """
     Detect if extracted PDF text is corrupted/garbled.
@@ -114,48 +387,32 @@ def _is_corrupted_text(text: str, sample_size: int = 2000) -> bool:
         - "'(LQ 0HWULNHQ EDVLHUWHU $QVDW] I\x81U GDV\n,QIRUPDWLRQVPDQDJHPHQW YRQ H/HDUQLQJ 3URMHNWHQ\n8ZH %OD]H\\ ± 5HLQHU \'XPNH\n8%,61(7 \x10 \"
         - "nmlkigkec `?=lg;97 6O=NecM=l `LmKJO;G7 6O=NecMle Fuligc=ls7 regmeOk= qeKpk=l7"
     """
-    if len(text) == 0:
+    # Sample from beginning (most indicative); slicing past the end is safe
+    sample = text[:sample_size]
+    if not sample:
         return True
 
-    # Sample from beginning (most indicative)
-    sample = text[:min(sample_size, len(text))]
-
-    # Count character categories
-    total_chars = len(sample)
-    alphabetic = sum(1 for c in sample if c.isalpha())
-    control_chars = sum(1 for c in sample if ord(c) < 32 and c not in '\n\r\t')
+    # The same document is checked by _segment(), title and author extraction;
+    # the cache is keyed on the sample, so each check runs once per document
+    return _is_corrupted_sample(sample)
 
-    # Calculate proportions
-    alpha_ratio = alphabetic / total_chars
-    control_ratio = control_chars / total_chars
 
-    # Thresholds based on expected German/English text (40-60% alphabetic)
-    if alpha_ratio < 0.30:  # Less than 30% alphabetic
-        return True
-    if control_ratio > 0.20:  # More than 20% control characters
-        return True
-
-    # Check for letter-digit transitions (corrupted text often has digits mixed with letters)
-    # Pattern: letter immediately adjacent to digit (e.g., "E4M", "pM1", "c4")
-    # Normal technical terms (Web2.0, HTML5, UTF8) have lower density even in CS papers
-    pattern = r'[a-zA-ZäöüÄÖÜß]\d|\d[a-zA-ZäöüÄÖÜß]'
-    transitions = len(re.findall(pattern, sample))
-    transition_ratio = transitions / total_chars
-
-    # 15% threshold chosen for DELFI e-learning CS publications (allows technical terms)
-    if transition_ratio > 0.15:
-        return True
+@lru_cache(maxsize=16)
+def _is_corrupted_sample(sample: str) -> bool:
+    """Run the heuristics of _is_corrupted_text() on a non-empty sample."""
+    # Checks run cheapest first and return as soon as one fires;
+    # every check is independent, so the order does not change the result
+    total_chars = len(sample)
 
     # Check for undefined C1 bytes that indicate encoding corruption
     # Bytes 129, 141, 143, 144, 157 are undefined in ALL standard encodings
     # (Windows-1252, ISO-8859-1, UTF-8, etc.) and indicate wrong codepage/missing CMap
     # Example: \x81 appears when PDF uses custom encoding without proper Unicode mapping
     # Note: Some C1 bytes ARE legitimate (e.g., 150=en-dash, 145-148=smart quotes)
-    undefined_c1_bytes = {129, 141, 143, 144, 157}
-    undefined_chars = sum(1 for c in sample if ord(c) in undefined_c1_bytes)
-
-    # Even a single undefined byte indicates severe encoding corruption
-    if undefined_chars > 0:
+    # Even a single undefined byte indicates severe encoding corruption,
+    # so stop at the first one instead of counting them all
+    undefined_c1_chars = {'\x81', '\x8d', '\x8f', '\x90', '\x9d'}
+    if not undefined_c1_chars.isdisjoint(sample):
         return True
 
     # Check for unusual punctuation density (wrong character mapping/substitution)
@@ -165,7 +422,7 @@ def _is_corrupted_text(text: str, sample_size: int = 2000) -> bool:
     # - ';' is rare in German text (used sparingly for lists/complex sentences)
     # Example corrupted text: "nmlkigkec `?=lg;97 6O=NecM=l `LmKJO;G7"
     # Threshold: 3% chosen to allow legitimate CS papers with equations while catching corruption
-    unusual_punct = sum(1 for c in sample if c in '=;')
+    unusual_punct = sample.count('=') + sample.count(';')
     unusual_punct_ratio = unusual_punct / total_chars
 
     # If > 3% of characters are '=' or ';', text is likely corrupted
@@ -173,50 +430,52 @@ def _is_corrupted_text(text: str, sample_size: int = 2000) -> bool:
     if unusual_punct_ratio > 0.03:
         return True
 
+    # Control characters (translate keeps the per-character work in C)
+    control_chars = total_chars - len(sample.translate(_CONTROL_CHARS_DELETE))
+    control_ratio = control_chars / total_chars
+    if control_ratio > 0.20:  # More than 20% control characters
+        return True
+
+    # Thresholds based on expected German/English text (40-60% alphabetic)
+    alphabetic = sum(map(str.isalpha, sample))
+    alpha_ratio = alphabetic / total_chars
+    if alpha_ratio < 0.30:  # Less than 30% alphabetic
+        return True
+
+    # Check for letter-digit transitions (corrupted text often has digits mixed with letters)
+    # Pattern: letter immediately adjacent to digit (e.g., "E4M", "pM1", "c4")
+    # Normal technical terms (Web2.0, HTML5, UTF8) have lower density even in CS papers
+    transitions = len(_RE_LETTER_DIGIT_TRANSITION.findall(sample))
+    transition_ratio = transitions / total_chars
+
+    # 15% threshold chosen for DELFI e-learning CS publications (allows technical terms)
+    if transition_ratio > 0.15:
+        return True
+
     return False
 
 
-def extract_main_content(raw_text: str) -> Optional[str]:
+def _find_main_content_start(raw_text: str) -> int | None:
     """
-    Extract main text content (between intro section and references).
+    Find where the main content starts (Step 1 of extract_main_content).
 
-    Pattern Hierarchy:
-        1. Number + Keywords: "1 Introduction", "1\\nEinleitung", etc.
-        2. Keywords only: "Introduction" or "Einleitung" standalone (fallback)
-        3. Below Abstract: paragraph after "Abstract:" when no Keywords exist
-        4. Below Keywords: line after "Keywords:" for papers without numbered sections
-        5. Number + Any title: "1   Two Traditions" (up to ~80 chars)
-        6. After author/affiliation: for short papers without standard sections
+    Runs the pattern hierarchy documented in extract_main_content().
 
     Args:
         raw_text: Full text extracted from PDF
 
     Returns:
-        Main content text between start and references section, or None if no structure detected
+        Start position of the main content, or None if no pattern matched
     """
-    # Check for corrupted text FIRST (before any pattern matching)
-    if _is_corrupted_text(raw_text):
-        print("WARNING: Corrupted PDF text detected (garbled encoding, missing CMap, or font issues).")
-        print("         Extraction not possible. Returning None.")
-        return None #for debugging (later: return None)
-
     start_pos = None
 
     # === STEP 1: Find where main content STARTS ===
 
     # Priority 1: Number + relevant Keywords combination (e.g.,Introduction/Einleitung)
     # Check these FIRST to capture the section number when present
-    patterns_priority_1 = [
-        r'^\s*1\s*\n\s*(?:Introduction|Einleitung|Einführung|Background|Motivation|Hintergrund)',      # e.g., " 1\nIntroduction" or "1\nIntroduction"
-        r'^\s*1\.?\s+(?:Introduction|Einleitung|Einführung|Background|Motivation|Hintergrund)',         # e.g., " 1 Introduction" or "1. Introduction"
-        r'^\s*1:\s*(?:Introduction|Einleitung|Einführung|Background|Motivation|Hintergrund)',           # e.g., " 1: Introduction" or "1: Introduction"
-    ]
-
-    for pattern in patterns_priority_1:
-        match = re.search(pattern, raw_text, re.MULTILINE | re.IGNORECASE)
-        if match:
-            start_pos = match.start()
-            break
+    match = _search_by_priority(_RE_PRIORITY_1, raw_text)
+    if match:
+        start_pos = match.start()
 
     # Priority 2: Keywords only (standalone line) - fallback when no number present
     if start_pos is None:
@@ -225,67 +484,46 @@ def extract_main_content(raw_text: str) -> Optional[str]:
         # Strategy: Search in a limited region near the document start
 
         # Check if Abstract exists to define search region
-        pattern_abstract_check = r'^(?:Abstract|Zusammenfassung|Kurzfassung|Summary|Résumé):\s*'
-        abstract_check = re.search(pattern_abstract_check, raw_text, re.MULTILINE | re.IGNORECASE)
+        abstract_check = _RE_ABSTRACT.search(raw_text)
 
         if abstract_check:
             # If Abstract exists, search only in first 2000 chars after Abstract (typical abstract length: 150-300 words)
             # (covers typical abstract + introduction header for both short and long papers)
             search_start = abstract_check.start()
             search_end = min(len(raw_text), abstract_check.start() + 2000)
-            search_region = raw_text[search_start:search_end]
-            offset = search_start
         else:
             # If no Abstract, also search in first 2000 chars of document
-            search_region = raw_text[:2000]
-            offset = 0
+            search_start = 0
+            search_end = 2000
 
-        patterns_priority_2 = [
-            r'^\s*(?:Introduction|Einleitung|Einführung|Problemstellung)\s*$',  # Allow leading/trailing whitespace ("Problemstellung appeared in one empirical case")
-            r'^\s*(?:Introduction|Einleitung|Einführung):\s*.+$',  # e.g., "Introduction: subtitle"
-            r'^\s*(?:Introduction|Einleitung|Einführung)[\s–—-]+.{1,50}$',  # e.g., "Einleitung – Die chinesisch-deutsche..." (handles em-dash, en-dash, hyphen); Added a length limit to match intro headers but no text in the main body
-        ]
-
-        for pattern in patterns_priority_2:
-            match = re.search(pattern, search_region, re.MULTILINE | re.IGNORECASE)
-            if match:
-                start_pos = offset + match.start()
-                break
+        # pos/endpos instead of slicing (search_start is a line start, so '^' behaves the same)
+        match = _search_by_priority(_RE_PRIORITY_2, raw_text, search_start, search_end)
+        if match:
+            start_pos = match.start()
 
     # Priority 3: Below Abstract - for papers with abstract but no Keywords/Introduction
     # Strategy 1: Numbered section heading
     # Strategy 2: Blank-line detection (paragraph break after Abstract)
     # Strategy 3: Period-newline-capital detection with minimum distance safeguard
     if start_pos is None:
-        has_keywords = re.search(r'^(?:Keywords|Key\s+words|Schlüsselwörter|Schlagwörter|Keyphrases|Key\s+phrases|Index\s+Terms|Suchbegriffe|Stichwörter|Indexbegriffe):\s*', raw_text, re.MULTILINE | re.IGNORECASE) #look whether there are keywords below the abstract
+        has_keywords = _RE_KEYWORDS_LABEL.search(raw_text) #look whether there are keywords below the abstract
         if not has_keywords: # Only execute if paper lacks keywords (if it has keywords go to priority 4)
 
             # Match "Abstract:" or German equivalent "Zusammenfassung:"
-            pattern_abstract = r'^(?:Abstract|Zusammenfassung|Kurzfassung|Summary|Résumé):\s*'
-            match = re.search(pattern_abstract, raw_text, re.MULTILINE | re.IGNORECASE)
+            match = _RE_ABSTRACT.search(raw_text)
             if match:
                 remaining = raw_text[match.end():]
 
                 # Strategy 1: Look for numbered section first (e.g., "1 Title" or "1\nTitle") -> same regex patterns used as in Priority 5 below
-                patterns_numbered = [
-                    r'^\s*1\.?\s+[A-Za-zÄÖÜäöü][^\n]{0,80}$',  # "1   Title" or "1. Title"
-                    r'^\s*1\s*\n\s*[A-Za-zÄÖÜäöü][^\n]{0,80}$',  # "1\nTitle"
-                ]
-                for pattern in patterns_numbered:
-                    match_num = re.search(pattern, remaining, re.MULTILINE)
-                    if match_num:
-                        start_pos = match.end() + match_num.start()
-                        break
+                match_num = _RE_NUMBERED_HEADING.search(remaining)
+                if match_num:
+                    start_pos = match.end() + match_num.start()
 
                 # Strategy 2: Look for blank line followed by capital letter (only if Strategy 1 fails)
                 if start_pos is None:
-                    next_para = re.search(
-                                r'\n\s*\n+\s*(?!Keywords|Key\s+words|Schlüsselwörter|Schlagwörter|Keyphrases|Key\s+phrases|Index\s+Terms|Suchbegriffe|Stichwörter|Indexbegriffe)([A-ZÄÖÜ])', # negative lookahead to skip Keywords variants in the blank-line detection pattern
-                                remaining,
-                                re.IGNORECASE
-                            )
+                    next_para = _RE_NEXT_PARAGRAPH.search(raw_text, match.end())
                     if next_para:
-                        start_pos = match.end() + next_para.start(1)
+                        start_pos = next_para.start(1)
 
                 # Strategy 3: Period + newline + capital, with minimum distance safeguard (if Strategy 1 and 2 fail)
                 # Abstracts are typically 75-300 words (~400-1800 chars)
@@ -295,29 +533,27 @@ def extract_main_content(raw_text: str) -> Optional[str]:
 
                     # Step 2a: Look for pattern AFTER minimum threshold (handles medium/long abstracts)
                     if len(remaining) > MIN_ABSTRACT_CHARS:
-                        search_region = remaining[MIN_ABSTRACT_CHARS:]
-                        para_break = re.search(r'\.\n([A-ZÄÖÜ])', search_region)
+                        para_break = _RE_PERIOD_NEWLINE_CAPITAL.search(raw_text, match.end() + MIN_ABSTRACT_CHARS)
                         if para_break:
-                            start_pos = match.end() + MIN_ABSTRACT_CHARS + para_break.start(1)
+                            start_pos = para_break.start(1)
 
                     # Step 2b: Fallback for very short abstracts (< 75 words)
                     if start_pos is None:
-                        para_break = re.search(r'\.\n([A-ZÄÖÜ])', remaining)
+                        para_break = _RE_PERIOD_NEWLINE_CAPITAL.search(raw_text, match.end())
                         if para_break:
-                            start_pos = match.end() + para_break.start(1)
+                            start_pos = para_break.start(1)
 
     # Priority 4: Below Keywords - for papers where first section has no number
     if start_pos is None:
         # Find "Keywords:" line (English or German variants)
-        pattern_keywords = r'^(?:Keywords|Key\s+words|Schlüsselwörter|Schlagwörter|Keyphrases|Key\s+phrases|Index\s+Terms|Suchbegriffe|Stichwörter|Indexbegriffe):\s*.+$'
-        match = re.search(pattern_keywords, raw_text, re.MULTILINE | re.IGNORECASE)
+        match = _RE_KEYWORDS_LINE.search(raw_text)
         if match:
             remaining_text = raw_text[match.end():]
 
             # Define search region: section 1 header should appear directly below Keywords
             # Use position of first uppercase line as boundary to prevent matching
             # numbered list items that appear later in the document (e.g., in section 2)
-            first_uppercase_match = re.search(r'^\s*[A-ZÄÖÜ]', remaining_text, re.MULTILINE)
+            first_uppercase_match = _RE_UPPERCASE_LINE_START.search(remaining_text)
 
             if first_uppercase_match:
                 # Search up to first uppercase line + buffer (for multi-line headers)
@@ -332,44 +568,30 @@ def extract_main_content(raw_text: str) -> Optional[str]:
             # Strategy 1a: Unnumbered section header (for PyMuPDF extraction issues)
             # Handles cases where section number "1" is not extracted (e.g., graphics/vector text)
             # Matches section title without number prefix (e.g., "Ausgangspunkt der empirischen Studie")
-            pattern_unnumbered = r'^\s*[A-Za-zÄÖÜäöü][^\n]{0,80}$'
-            match_unnumbered = re.search(pattern_unnumbered, search_region, re.MULTILINE)
+            match_unnumbered = _RE_UNNUMBERED_HEADER.search(search_region)
             if match_unnumbered:
                 start_pos = match.end() + match_unnumbered.start()
 
             # Strategy 1b: Numbered section header (normal case)
             # Only search within limited region to avoid matching list items in later sections
             if start_pos is None:
-                patterns_numbered = [
-                    r'^\s*1\.?\s+[A-Za-zÄÖÜäöü][^\n]{0,80}$',  # "1   Title" or "1. Title"
-                    r'^\s*1\s*\n\s*[A-Za-zÄÖÜäöü][^\n]{0,80}$',  # "1\nTitle"
-                ]
-                for pattern in patterns_numbered:
-                    match_num = re.search(pattern, search_region, re.MULTILINE)
-                    if match_num:
-                        start_pos = match.end() + match_num.start()
-                        break
+                match_num = _RE_NUMBERED_HEADING.search(search_region)
+                if match_num:
+                    start_pos = match.end() + match_num.start()
 
             # Strategy 2: Find the next non-empty line after Keywords (starts with uppercase)
             # Fallback for unusual papers (searches entire remaining_text)
             if start_pos is None: #only runs if Strategy 1 was not successful
-                next_line_match = re.search(r'^\s*[A-ZÄÖÜ][^\n]+$', remaining_text, re.MULTILINE)
+                next_line_match = _RE_UPPERCASE_LINE.search(remaining_text)
                 if next_line_match:
                     start_pos = match.end() + next_line_match.start()
 
     # Priority 5: Number + Any section title (for titles like "Two Traditions")
     # Matches " 1   Title Text" or " 1\nTitle Text" where title is up to ~80 chars
     if start_pos is None:
-        patterns_priority_5 = [
-            r'^\s*1\.?\s+[A-Za-zÄÖÜäöü][^\n]{0,80}$',  # e.g., " 1   Two Traditions" or "1. Title" (same line)
-            r'^\s*1\s*\n\s*[A-Za-zÄÖÜäöü][^\n]{0,80}$',    # e.g., " 1\nTwo Traditions" (separate line)
-        ]
-
-        for pattern in patterns_priority_5:
-            match = re.search(pattern, raw_text, re.MULTILINE)
-            if match:
-                start_pos = match.start()
-                break
+        match = _RE_NUMBERED_HEADING.search(raw_text)
+        if match:
+            start_pos = match.start()
 
     # # Priority 6: After author/affiliation - for short papers without sections
     # # Only executes if all other patterns (1-5) have failed
@@ -449,59 +671,171 @@ def extract_main_content(raw_text: str) -> Optional[str]:
     #     # Conservative approach: if uncertain, leave start_pos = None
     #     # (will return None below instead of guessing)
 
-    # return None if no pattern found
-    if start_pos is None:
-        return None
+    return start_pos
 
-    # === STEP 2: Find where main content ENDS (references section) ===
-    # Matches: optional section number (separate/same line) + keyword + optional footnote
-    # Examples: "Literatur", "5\nLiteratur", "5  Literatur", "5. Literatur", "Literatur1", "Bibliografie"
-    pattern_refs = r'^\s*(?:\d+\s*\n\s*|\d+\.?\s+)?(References|Literaturverzeichnis|Literaturverhzeichnis|Literatur|Bibliography|Bibliografie|Literature|Referenzen|Quellenverzeichnis|Quellen|Reference\s+List|Literaturverzeichnis\s+und\s+Internetquellen)\d*\s*$'
-    #match = re.search(pattern_refs, raw_text, re.MULTILINE | re.IGNORECASE)
 
+def _find_references_heading(raw_text: str) -> re.Match | None:
+    """
+    Find the heading of the references section.
+
+    Shared by extract_main_content() (end of main content) and extract_references()
+    (start of references). Takes the last heading in the second half of the document
+    that is followed by at least one reference entry.
+
+    Args:
+        raw_text: Full text extracted from PDF
+
+    Returns:
+        Match of the references heading, or None if not found
+    """
     # Position constraint: references must be in last 50% of document to avoid false positives
     # (e.g., "aus Vorlesungen und Literatur in der Regel" in body text)
     text_length = len(raw_text)
     min_position = int(text_length * 0.50)
 
     # Find ALL candidate reference headings in last 50% of document
+    # (scanning starts near min_position instead of at the beginning of the text)
     candidates = [
-        m for m in re.finditer(pattern_refs, raw_text, re.MULTILINE | re.IGNORECASE)
+        m for m in _RE_REFERENCES_HEADING.finditer(raw_text, _heading_scan_start(raw_text, min_position))
         if m.start() >= min_position
     ]
 
-    # Reference entry validation: Support multiple citation styles
-    # Style 1: DeLFI-style [BBS01], [HKN01], [Ka93]
-    # Style 2: Numeric [1], [2], [123]
-    # Style 3: Author-year without brackets: Bruner, J.S. (1961)
-    # Style 4: Author-year with brackets: [Adler 2006], [Weber-Wulff 2002], [ISO 2006]
-    REFERENCE_PATTERNS = [
-        r'\s*\[(?:[A-Za-z]{2,4}|[A-Z][a-z]{1,2})\d{2}\]',  # DeLFI-style
-        r'^\s*\[\d{1,3}\]',  # Numeric style
-        r'^[A-ZÄÖÜ][a-zäöüß]+,\s+[A-Z].*?\(\d{4}\)',  # Author-year style
-        r'\s*\[[A-Z][A-Za-z-]+\s+\d{4}\]',  # Author-year bracketed style
-    ]
-
     match = None
 
     # Prefer the LAST valid references section
     for m in reversed(candidates):
-        # Look shortly AFTER the heading
-        sample = raw_text[m.end(): min(len(raw_text), m.end() + 1500)]
+        # Look shortly AFTER the heading (pos/endpos window, no slice copy)
+        window_end = m.end() + 1500
 
-        # Validate that real references follow (check all patterns)
-        is_valid = any(re.search(pattern, sample, re.MULTILINE) for pattern in REFERENCE_PATTERNS)
+        # Validate that real references follow (any citation style)
+        is_valid = _RE_REFERENCE_ENTRY.search(raw_text, m.end(), window_end) is not None
         if is_valid:
             match = m
             break
 
     # # Find first match in last 50% of document
     # match = None
-    # for m in re.finditer(pattern_refs, raw_text, re.MULTILINE | re.IGNORECASE):
+    # for m in _RE_REFERENCES_HEADING.finditer(raw_text):
     #     if m.start() >= min_position:
     #         match = m
     #         break
 
+    return match
+
+
+def _clean_references(raw_text: str, heading: re.Match) -> str:
+    """
+    Cut the references section after its heading and remove the trailing line.
+
+    Args:
+        raw_text: Full text extracted from PDF
+        heading: Match returned by _find_references_heading()
+
+    Returns:
+        References section text (without heading)
+    """
+    # Start AFTER the heading (use heading.end() to exclude "References" word)
+    # Work with offsets into raw_text and slice once at the end
+    # (same result as raw_text[heading.end():].strip() + cutting/stripping the trailing line)
+    start = heading.end()
+    end = len(raw_text)
+    while start < end and raw_text[start].isspace():
+        start += 1
+    while end > start and raw_text[end - 1].isspace():
+        end -= 1
+
+    # === Remove trailing line (separate patterns for debugging) ===
+
+    # Patterns A-C can only match the last two non-blank lines (B and C may put the
+    # page number on its own line), so only that tail is searched
+    tail_start = raw_text.rfind('\n', start, end)
+    while tail_start > start:
+        line_start = raw_text.rfind('\n', start, tail_start)
+        if line_start == -1:
+            line_start = start - 1
+        line = raw_text[line_start + 1:tail_start]
+        tail_start = line_start
+        if line and not line.isspace():
+            break
+    tail_start = max(tail_start, start)
+
+    # endpos makes '$' match at the end of the references, as on the stripped copy
+    # Patterns A-C are tried in that order (first pattern that matches wins)
+    trailing = _search_by_priority(_RE_TRAILING_LINE, raw_text, tail_start, end)
+
+    if trailing:
+        end = trailing.start()
+        while end > start and raw_text[end - 1].isspace():
+            end -= 1
+
+    return raw_text[start:end]
+
+
+def _segment(raw_text: str) -> tuple[str | None, str | None]:
+    """
+    Split PDF text into main content and references in one pass.
+
+    Same results as calling extract_main_content() and extract_references(), but the
+    corruption check and the references heading search run only once.
+
+    Args:
+        raw_text: Full text extracted from PDF
+
+    Returns:
+        Tuple of (main content, references); each is None if not found
+    """
+    # Check for corrupted text FIRST (before any pattern matching)
+    if _is_corrupted_text(raw_text):
+        print("WARNING: Corrupted PDF text detected (garbled encoding, missing CMap, or font issues).")
+        print("         Extraction not possible. Returning None.")
+        return None, None
+
+    start_pos = _find_main_content_start(raw_text)
+    heading = _find_references_heading(raw_text)
+
+    main_content = None
+    if start_pos is not None:
+        end_pos = heading.start() if heading else len(raw_text)
+        main_content = raw_text[start_pos:end_pos]
+
+    references = _clean_references(raw_text, heading) if heading else None
+    return main_content, references
+
+
+def extract_main_content(raw_text: str) -> Optional[str]:
+    """
+    Extract main text content (between intro section and references).
+
+    Pattern Hierarchy:
+        1. Number + Keywords: "1 Introduction", "1\\nEinleitung", etc.
+        2. Keywords only: "Introduction" or "Einleitung" standalone (fallback)
+        3. Below Abstract: paragraph after "Abstract:" when no Keywords exist
+        4. Below Keywords: line after "Keywords:" for papers without numbered sections
+        5. Number + Any title: "1   Two Traditions" (up to ~80 chars)
+        6. After author/affiliation: for short papers without standard sections
+
+    Args:
+        raw_text: Full text extracted from PDF
+
+    Returns:
+        Main content text between start and references section, or None if no structure detected
+    """
+    # Check for corrupted text FIRST (before any pattern matching)
+    if _is_corrupted_text(raw_text):
+        print("WARNING: Corrupted PDF text detected (garbled encoding, missing CMap, or font issues).")
+        print("         Extraction not possible. Returning None.")
+        return None #for debugging (later: return None)
+
+    # === STEP 1: Find where main content STARTS ===
+    start_pos = _find_main_content_start(raw_text)
+
+    # return None if no pattern found
+    if start_pos is None:
+        return None
+
+    # === STEP 2: Find where main content ENDS (references section) ===
+    match = _find_references_heading(raw_text)
+
     if match:
         end_pos = match.start()
     else:
@@ -532,82 +866,11 @@ def extract_references(raw_text: str) -> Optional[str]:
     if _is_corrupted_text(raw_text):
         return None
 
-    # Find references section - match the heading line
-    # Matches: optional section number (separate/same line) + keyword + optional footnote
-    # Examples: "Literatur", "5\nLiteratur", "5  Literatur", "5. Literatur", "Literatur1", "Bibliografie"
-    pattern_refs_start = r'^\s*(?:\d+\s*\n\s*|\d+\.?\s+)?(References|Literaturverzeichnis|Literaturverhzeichnis|Literatur|Bibliography|Bibliografie|Literature|Referenzen|Quellenverzeichnis|Quellen|Reference\s+List|Literaturverzeichnis\s+und\s+Internetquellen)\d*\s*$'
-    #match = re.search(pattern_refs_start, raw_text, re.MULTILINE | re.IGNORECASE)
-
-    # Position constraint: references must be in last 50% of document to avoid false positives
-    # (e.g., "aus Vorlesungen und Literatur in der Regel" in body text)
-    text_length = len(raw_text)
-    min_position = int(text_length * 0.50)  # Must be in last 50%
-
-    # Find all candidate reference headings in last 50%
-    candidates = [
-        m for m in re.finditer(pattern_refs_start, raw_text, re.MULTILINE | re.IGNORECASE)
-        if m.start() >= min_position
-    ]
-
-    # Reference entry validation: Support multiple citation styles
-    # Style 1: DeLFI-style [BBS01], [HKN01], [Ka93]
-    # Style 2: Numeric [1], [2], [123]
-    # Style 3: Author-year without brackets: Bruner, J.S. (1961)
-    # Style 4: Author-year with brackets: [Adler 2006], [Weber-Wulff 2002], [ISO 2006]
-    REFERENCE_PATTERNS = [
-        r'\s*\[(?:[A-Za-z]{2,4}|[A-Z][a-z]{1,2})\d{2}\]',  # DeLFI-style
-        r'^\s*\[\d{1,3}\]',  # Numeric style
-        r'^[A-ZÄÖÜ][a-zäöüß]+,\s+[A-Z].*?\(\d{4}\)',  # Author-year style
-        r'\s*\[[A-Z][A-Za-z-]+\s+\d{4}\]',  # Author-year bracketed style
-    ]
-
-    match = None
-    for m in reversed(candidates):
-        sample = raw_text[m.end(): min(len(raw_text), m.end() + 1500)]
-        # Validate that real references follow (check all patterns)
-        is_valid = any(re.search(pattern, sample, re.MULTILINE) for pattern in REFERENCE_PATTERNS)
-        if is_valid:
-            match = m
-            break
-
-    # # Find first match in last 50% of document
-    # match = None
-    # for m in re.finditer(pattern_refs_start, raw_text, re.MULTILINE | re.IGNORECASE):
-    #     if m.start() >= min_position:
-    #         match = m
-    #         break
-
-
+    match = _find_references_heading(raw_text)
     if not match:
         return None
 
-    # Start AFTER the heading (use match.end() to exclude "References" word)
-    references = raw_text[match.end():].strip()
-
-    # === Remove trailing line (separate patterns for debugging) ===
-
-    # Pattern A: Just page number (e.g., "449", "22")
-    pattern_a = r'\n\d{1,4}\s*$'
-    match_a = re.search(pattern_a, references)
-    if match_a:
-        references = references[:match_a.start()]
-        return references.strip()
-
-    # Pattern B: Page number + authors (e.g., "208 Alexander Aumann et al.")
-    pattern_b = r'\n\d{1,4}\s+[A-ZÄÖÜ][a-zäöüß]+.*$'
-    match_b = re.search(pattern_b, references)
-    if match_b:
-        references = references[:match_b.start()]
-        return references.strip()
-
-    # Pattern C: Title + page number (e.g., "The interplay... 21")
-    pattern_c = r'\n[A-ZÄÖÜ].+\s+\d{1,4}\s*$'
-    match_c = re.search(pattern_c, references)
-    if match_c:
-        references = references[:match_c.start()]
-        return references.strip()
-
-    return references.strip()
+    return _clean_references(raw_text, match)
 
 
 
@@ -645,12 +908,7 @@ def extract_title_from_pdf(raw_text: str, max_lines: int = 5, max_chars: int = 8
     
     # === STEP 1: Skip header lines (for lni262, lni273, lni247 format) ===
 
-    # Header detection patterns
-    header_patterns = [
-        r'\(Hrsg\.\)',  # "(Hrsg.)"
-        r'Lecture Notes in Informatics',  # "Lecture Notes in Informatics (LNI)"
-        r'Gesellschaft für Informatik',  # "Gesellschaft für Informatik, Bonn 2016"
-    ]
+    # Header detection pattern: _RE_TITLE_HEADER_LINE
 
     start_idx = 0
     for i, line in enumerate(lines[:5]):  # Check first 5 lines only
@@ -660,13 +918,8 @@ def extract_title_from_pdf(raw_text: str, max_lines: int = 5, max_chars: int = 8
         if not line_stripped:
             continue
 
-        # Check if line is header metadata
-        is_header = any(re.search(pattern, line_stripped, re.IGNORECASE) for pattern in header_patterns)
-
-        # Check if line is just a page number (1-3 digits alone)
-        is_page_number = re.match(r'^\d{1,3}$', line_stripped)
-
-        if is_header or is_page_number:
+        # Check if line is header metadata or just a page number
+        if _RE_TITLE_HEADER_LINE.search(line_stripped):
             start_idx = i + 1  # Start after this line
         else:
             # First non-header line found
@@ -688,56 +941,9 @@ def extract_title_from_pdf(raw_text: str, max_lines: int = 5, max_chars: int = 8
     
     title_lines = []
     
-    # Author patterns (German academic papers)
-    # Character classes for international names:
-    # - German: äöüÄÖÜß
-    # - Spanish/Portuguese: áéíóúÁÉÍÓÚñÑãõÃÕ
-    # - French: àèéêëìîïôùûçÀÈÉÊËÌÎÏÔÙÛÇ
-    # - Eastern European: ăășțĂȘȚčšžČŠŽđĐłŁńŃśŚźŹżŻąĄęĘćĆ
-    # - Ill-formed diacritics: ¨´` (from PDF extraction errors)
-    UPPER = r'[A-ZÄÖÜÁÉÍÓÚÀÈÌÒÙÂÊÎÔÛÃÕÑĂĂȘȚČŠŽĐŁŃŚŹŻĄĘĆ]'
-    LOWER = r'[a-zäöüßáéíóúàèìòùâêîôûãõñăășțčšžđłńśźżąęć¨´`]'
-
-    # Firstname pattern: supports hyphenated names
-    # Examples: "Annette", "Chiu-Li", "Marie-Claire", "Jean-Paul"
-    FIRSTNAME = rf'{UPPER}{LOWER}+(?:-{UPPER}{LOWER}+)*'
-
-    # Middle name: optional middle initial or full middle name (with optional hyphens)
-    # Examples: "G. ", "A. ", "H. " (initials)
-    #           "Michael ", "Alexander ", "Marie-Claire " (full names, possibly hyphenated)
-    MIDDLE_NAME = rf'(?:(?:[A-Z]\.?\s+)|(?:{UPPER}{LOWER}+(?:-{UPPER}{LOWER}+)*\s+))?'
-
-    # Pattern 1: Multiple names with commas
-    # Examples: "Dominik Niehus, Patrik Erren"
-    #           "Ian G. Kennedy1, Paul H. Vossen2" (with middle initials)
-    #           "Kai Michael Höver, Guido Rößling" (with full middle names)
-    #           "Erika Ábrahám, Philipp Brauner" (with accented characters)
-    #           "Annette Baumann1, Chiu-Li Tseng2" (with hyphenated names)
-    # Format: Firstname [MiddleName] Lastname[markers], ...
-    author_pattern_commas = rf'^{FIRSTNAME}\s+{MIDDLE_NAME}{FIRSTNAME}[\s\d*†‡§¶כ]*,.*{FIRSTNAME}'
-
-    # Pattern 2: Names with "und" or "&" (German/English "and")
-    # Examples: "Sven Manske2 und H. Ulrich Hoppe2"
-    #           "Peter A. Henning und Klaus Müller" (with middle initials/names)
-    #           "Sven Strickroth1 & Niels Pinkwart2" (with ampersand)
-    #           "Ahmad Fatoum2und Jörg Abke1" (PDF extraction error: missing space)
-    #           "Annette Baumann1 und Chiu-Li Tseng2" (with hyphenated names)
-    # Strategy: Look for "und" or "&" pattern, then validate with affiliation markers
-    # Allow digit before "und" to handle PDF extraction errors (e.g., "2und" instead of "2 und")
-    author_pattern_und_base = rf'(?:[\s\d]und\s|\s&\s){FIRSTNAME}\s+{MIDDLE_NAME}{FIRSTNAME}'
-
-    # Pattern 3: Single author
-    # Examples: "Klaus Wannemacher", "Andrea Kienle", "Chiu-Li Tseng"
-    # Format: Firstname [MiddleName] Lastname[markers] (end of line)
-    author_pattern_single = rf'^{FIRSTNAME}\s+{MIDDLE_NAME}{FIRSTNAME}[\s\d*†‡§¶כ]*$'
-
-    # Institution keywords to distinguish institution names from author names
-    # (e.g., "Hochschule Pforzheim" vs "Klaus Wannemacher")
-    institution_keywords = [
-        'hochschule', 'universität', 'institut', 'fakultät',
-        'university', 'institute', 'faculty', 'department',
-        'fachbereich', 'lehrstuhl', 'fraunhofer', 'school', 'college'
-    ]
+    # Author patterns: _RE_AUTHOR_COMMAS, _RE_AUTHOR_UND, _RE_AUTHOR_SINGLE (module level)
+
+    # Institution keywords: _RE_TITLE_INSTITUTION (module level)
 
     for i in range(start_idx, min(len(lines), start_idx + max_lines + 3)):
         line_stripped = lines[i].strip()
@@ -749,15 +955,15 @@ def extract_title_from_pdf(raw_text: str, max_lines: int = 5, max_chars: int = 8
         # Stop if we hit author line (check all patterns)
 
         # Pattern 1: Comma-separated names (always reliable)
-        if re.search(author_pattern_commas, line_stripped):
+        if _RE_AUTHOR_COMMAS.search(line_stripped):
             break
 
         # Pattern 2: "und" or "&" - requires additional validation
         # Check if line has "und" or "&" pattern AND affiliation markers (digits/symbols)
-        if re.search(author_pattern_und_base, line_stripped):
+        if _RE_AUTHOR_UND.search(line_stripped):
             # Additional validation: line should start with name pattern and contain affiliation markers
-            has_affiliation_markers = bool(re.search(r'[A-ZÄÖÜ][a-zäöüß]+[\d*†‡§¶]', line_stripped))
-            starts_with_name = bool(re.match(rf'^{UPPER}{LOWER}+\s+{MIDDLE_NAME}{UPPER}{LOWER}+', line_stripped))
+            has_affiliation_markers = bool(_RE_NAME_WITH_MARKER.search(line_stripped))
+            starts_with_name = bool(_RE_AUTHOR_NAME_START.match(line_stripped))
 
             if has_affiliation_markers and starts_with_name:
                 # This is an author line (e.g., "Sven Strickroth1 & Niels Pinkwart2")
@@ -765,9 +971,9 @@ def extract_title_from_pdf(raw_text: str, max_lines: int = 5, max_chars: int = 8
             # Otherwise: likely title phrase with "und" (e.g., "Badges und Open Badges"), continue collecting
 
         # Pattern 3: Single author - check if it's actually an institution name or 2-word title
-        if re.match(author_pattern_single, line_stripped):
+        if _RE_AUTHOR_SINGLE.match(line_stripped):
             # Check 1: Institution keywords (e.g., "Hochschule Pforzheim" in title)
-            if any(keyword in line_stripped.lower() for keyword in institution_keywords):
+            if _RE_TITLE_INSTITUTION.search(line_stripped.lower()):
                 pass  # Institution name in title, continue collecting
             else:
                 # Check 2: Conservative lookahead to distinguish 2-word title from single author
@@ -782,9 +988,9 @@ def extract_title_from_pdf(raw_text: str, max_lines: int = 5, max_chars: int = 8
                         continue  # Skip empty lines
 
                     # Check if next line has multiple authors (comma or "und" with affiliation markers)
-                    has_comma = bool(re.search(author_pattern_commas, next_line))
-                    has_und = bool(re.search(author_pattern_und_base, next_line) and
-                                   re.search(r'[A-ZÄÖÜ][a-zäöüß]+[\d*†‡§¶]', next_line))
+                    has_comma = bool(_RE_AUTHOR_COMMAS.search(next_line))
+                    has_und = bool(_RE_AUTHOR_UND.search(next_line) and
+                                   _RE_NAME_WITH_MARKER.search(next_line))
 
                     if has_comma or has_und:
                         next_has_multiple_authors = True
@@ -821,7 +1027,7 @@ def extract_title_from_pdf(raw_text: str, max_lines: int = 5, max_chars: int = 8
     title = title.replace('- ', '-')
 
     # Clean up multiple spaces
-    title = re.sub(r'\s+', ' ', title)
+    title = _RE_WHITESPACE_RUN.sub(' ', title)
     
     return title.strip()
 
@@ -852,22 +1058,13 @@ def _extract_title_lines_raw(raw_text: str, max_lines: int = 5, max_chars: int =
     lines = search_region.split('\n')
 
     # === STEP 1: Skip header lines ===
-    header_patterns = [
-        r'\(Hrsg\.\)',
-        r'Lecture Notes in Informatics',
-        r'Gesellschaft für Informatik',
-    ]
-
     start_idx = 0
     for i, line in enumerate(lines[:5]):
         line_stripped = line.strip()
         if not line_stripped:
             continue
 
-        is_header = any(re.search(pattern, line_stripped, re.IGNORECASE) for pattern in header_patterns)
-        is_page_number = re.match(r'^\d{1,3}$', line_stripped)
-
-        if is_header or is_page_number:
+        if _RE_TITLE_HEADER_LINE.search(line_stripped):
             start_idx = i + 1
         else:
             break
@@ -884,21 +1081,7 @@ def _extract_title_lines_raw(raw_text: str, max_lines: int = 5, max_chars: int =
     # === STEP 2: Collect title lines ===
     title_lines = []
 
-    # Author patterns (same as used throughout)
-    UPPER = r'[A-ZÄÖÜÁÉÍÓÚÀÈÌÒÙÂÊÎÔÛÃÕÑĂUȘȚČŠŽĐŁŃŚŹŻĄĘĆ]'
-    LOWER = r'[a-zäöüßáéíóúàèìòùâêîôûãõñăușțčšžđłńśźżąęć¨´`]'
-    FIRSTNAME = rf'{UPPER}{LOWER}+(?:-{UPPER}{LOWER}+)*'
-    MIDDLE_NAME = rf'(?:(?:[A-Z]\.?\s+)|(?:{UPPER}{LOWER}+(?:-{UPPER}{LOWER}+)*\s+))?'
-
-    author_pattern_commas = rf'^{FIRSTNAME}\s+{MIDDLE_NAME}{FIRSTNAME}[\s\d*†‡§¶כ]*,.*{FIRSTNAME}'
-    author_pattern_und_base = rf'(?:[\s\d]und\s|\s&\s){FIRSTNAME}\s+{MIDDLE_NAME}{FIRSTNAME}'
-    author_pattern_single = rf'^{FIRSTNAME}\s+{MIDDLE_NAME}{FIRSTNAME}[\s\d*†‡§¶כ]*$'
-
-    institution_keywords = [
-        'hochschule', 'universität', 'institut', 'fakultät',
-        'university', 'institute', 'faculty', 'department',
-        'fachbereich', 'lehrstuhl', 'fraunhofer', 'school', 'college'
-    ]
+    # Author patterns (same as used throughout): _RE_AUTHOR_COMMAS, _RE_AUTHOR_UND, _RE_AUTHOR_SINGLE
 
     end_idx = start_idx
     for i in range(start_idx, min(len(lines), start_idx + max_lines + 3)):
@@ -911,22 +1094,22 @@ def _extract_title_lines_raw(raw_text: str, max_lines: int = 5, max_chars: int =
         # Stop if we hit author line (check all patterns)
 
         # Pattern 1: Comma-separated names
-        if re.search(author_pattern_commas, line_stripped):
+        if _RE_AUTHOR_COMMAS.search(line_stripped):
             end_idx = i
             break
 
         # Pattern 2: "und" or "&"
-        if re.search(author_pattern_und_base, line_stripped):
-            has_affiliation_markers = bool(re.search(r'[A-ZÄÖÜ][a-zäöüß]+[\d*†‡§¶]', line_stripped))
-            starts_with_name = bool(re.match(rf'^{UPPER}{LOWER}+\s+{MIDDLE_NAME}{UPPER}{LOWER}+', line_stripped))
+        if _RE_AUTHOR_UND.search(line_stripped):
+            has_affiliation_markers = bool(_RE_NAME_WITH_MARKER.search(line_stripped))
+            starts_with_name = bool(_RE_AUTHOR_NAME_START.match(line_stripped))
 
             if has_affiliation_markers and starts_with_name:
                 end_idx = i
                 break
 
         # Pattern 3: Single author
-        if re.match(author_pattern_single, line_stripped):
-            if any(keyword in line_stripped.lower() for keyword in institution_keywords):
+        if _RE_AUTHOR_SINGLE.match(line_stripped):
+            if _RE_TITLE_INSTITUTION.search(line_stripped.lower()):
                 pass  # Institution name, continue collecting
             else:
                 # Lookahead to distinguish 2-word title from single author
@@ -937,9 +1120,9 @@ def _extract_title_lines_raw(raw_text: str, max_lines: int = 5, max_chars: int =
                     if not next_line:
                         continue
 
-                    has_comma = bool(re.search(author_pattern_commas, next_line))
-                    has_und = bool(re.search(author_pattern_und_base, next_line) and
-                                   re.search(r'[A-ZÄÖÜ][a-zäöüß]+[\d*†‡§¶]', next_line))
+                    has_comma = bool(_RE_AUTHOR_COMMAS.search(next_line))
+                    has_und = bool(_RE_AUTHOR_UND.search(next_line) and
+                                   _RE_NAME_WITH_MARKER.search(next_line))
 
                     if has_comma or has_und:
                         next_has_multiple_authors = True
@@ -999,34 +1182,10 @@ def extract_authors_from_pdf(raw_text: str, max_lines: int = 5) -> str | None:
     lines = raw_text[:2000].split('\n')
 
     # Step 3: Collect author lines
-    UPPER = r'[A-ZÄÖÜÁÉÍÓÚÀÈÌÒÙÂÊÎÔÛÃÕÑĂUȘȚČŠŽĐŁŃŚŹŻĄĘĆ]'
-    LOWER = r'[a-zäöüßáéíóúàèìòùâêîôûãõñăușțčšžđłńśźżąęć¨´`]'
-    FIRSTNAME = rf'{UPPER}{LOWER}+(?:-{UPPER}{LOWER}+)*'
-    MIDDLE_NAME = rf'(?:(?:[A-Z]\.?\s+)|(?:{UPPER}{LOWER}+(?:-{UPPER}{LOWER}+)*\s+))?'
+    # Pattern that indicates author lines: _RE_AUTHOR_NAME (module level)
+
+    # Institution keywords: _RE_AUTHOR_INSTITUTION (module level)
 
-    # Patterns that indicate author lines
-    author_pattern_commas = rf'{FIRSTNAME}\s+{MIDDLE_NAME}{FIRSTNAME}'
-    
-    # Institution keywords
-    institution_keywords_de = [
-        'lehrstuhl', 'professur', 'lehr- und forschungsgebiet', 'lehrgebiet',
-        'lehr- und forschungsgruppe', 'arbeitsgruppe', 'arbeitsbereich',
-        'fachgruppe', 'fachbereich', 'zentrum', 'zentrum für',
-        'kompetenzzentrum', 'kompetenz-center', 'e-learning center',
-        'universität', 'hochschule', 'institut', 'fakultät', 'abteilung',
-        'fernuniversität', 'donau-universität', 'oberstufenzentrum',
-        'multimedia', 'lab für informatik', 'beuth hochschule', 'fachgebiet',
-        'tu dortmund', 'lufg informatik', 'informatik und angewandte kognitionswissenschaft',
-        'gewerblich technisches', 'fg medienproduktion', 'dfg-graduiertenkolleg „qualitätsverbesserung im e-learning'
-    ]
-    
-    institution_keywords_en = [
-        'university', 'institute', 'faculty', 'department', 'college',
-        'school', 'laboratory', 'lab', 'center', 'center for', 'fraunhofer', 'research group'
-    ]
-    
-    all_institution_keywords = institution_keywords_de + institution_keywords_en
-    
     # Abstract keywords
     abstract_keywords = ['Abstract:', 'Zusammenfassung:', 'Kurzfassung:', 'Summary:', 'Résumé:']
     
@@ -1040,14 +1199,14 @@ def extract_authors_from_pdf(raw_text: str, max_lines: int = 5) -> str | None:
             # Blank line - check if next line is institution
             # Normalize diacritics before checking (handles PyMuPDF artifacts like Universit¨at)
             next_line_normalized = _normalize_diacritics(lines[i + 1].lower()) if i + 1 < len(lines) else ""
-            if any(kw in next_line_normalized for kw in all_institution_keywords):
+            if _RE_AUTHOR_INSTITUTION.search(next_line_normalized):
                 break
             continue
 
         # Stop at institution keywords
         # Normalize diacritics before checking (handles PyMuPDF artifacts like Universit¨at)
         line_normalized = _normalize_diacritics(line_stripped.lower())
-        if any(keyword in line_normalized for keyword in all_institution_keywords):
+        if _RE_AUTHOR_INSTITUTION.search(line_normalized):
             break
         
         # Stop at Abstract
@@ -1055,7 +1214,7 @@ def extract_authors_from_pdf(raw_text: str, max_lines: int = 5) -> str | None:
             break
         
         # Stop at email addresses (unless they're on author line)
-        if '@' in line_stripped and not re.search(author_pattern_commas, line_stripped):
+        if '@' in line_stripped and not _RE_AUTHOR_NAME.search(line_stripped):
             break
         
         # Collect this line (it passed all stop conditions)
@@ -1068,7 +1227,7 @@ def extract_authors_from_pdf(raw_text: str, max_lines: int = 5) -> str | None:
     
     # === POSTPROCESSING ===
     # Remove affiliation markers: digits and special symbols (*, †, ‡, §, ¶, כ)
-    authors = re.sub(r'[\d*†‡§¶כ¹²³⁴⁵⁶⁷⁸⁹⁰]+', '', authors)
+    authors = _RE_AFFILIATION_MARKERS.sub('', authors)
 
     # Fix separated diacritics (PyMuPDF extraction artifacts)
     # PyMuPDF extracts ü/ö/ä as ¨u/¨o/¨a (diacritic BEFORE letter)
@@ -1085,11 +1244,11 @@ def extract_authors_from_pdf(raw_text: str, max_lines: int = 5) -> str | None:
         authors = authors.replace(pattern, replacement)
 
     # Clean up spaces
-    authors = re.sub(r'\s+', ' ', authors).strip()
+    authors = _RE_WHITESPACE_RUN.sub(' ', authors).strip()
 
     # Remove trailing punctuation
-    authors = re.sub(r',\s*$', '', authors)
-    authors = re.sub(r'\s+und\s*$', '', authors)
+    authors = _RE_TRAILING_COMMA.sub('', authors)
+    authors = _RE_TRAILING_UND.sub('', authors)
     
     return authors.strip()
 
@@ -1101,21 +1260,65 @@ def extract_abstract_from_pdf(raw_text: str) -> str | None:
 def process_pdf_with_metadata(pdf_path: Path) -> dict:
     """Process PDF that has accompanying metadata file.
     Returns only: text, references (metadata provides the rest)."""
-    raw = extract_text_from_pdf(pdf_path)
+    raw = extract_text_from_pdf(pdf_path, stop_if_corrupted=True)
+    text, references = _segment(raw)
     return {
-        'text': extract_main_content(raw),
-        'references': extract_references(raw),
+        'text': text,
+        'references': references,
     }
 
 def process_pdf_without_metadata(pdf_path: Path) -> dict:
     """Process PDF that lacks metadata file.
     Returns: title, authors, year, abstract, text, references."""
-    raw = extract_text_from_pdf(pdf_path)
+    raw = extract_text_from_pdf(pdf_path, stop_if_corrupted=True)
+    text, references = _segment(raw)
     return {
         'title': extract_title_from_pdf(raw),
         'authors': extract_authors_from_pdf(raw),
         'abstract': extract_abstract_from_pdf(raw),
-        'text': extract_main_content(raw),
-        'references': extract_references(raw),
+        'text': text,
+        'references': references,
         # year must be inferred from folder name
-    }
\ No newline at end of file
+    }
+
+
+def _process_pdf_safe(pdf_path: Path, with_metadata: bool) -> dict:
+    """Worker for process_pdfs(): returns {'error': message} instead of raising."""
+    try:
+        if with_metadata:
+            return process_pdf_with_metadata(pdf_path)
+        return process_pdf_without_metadata(pdf_path)
+    except Exception as e:
+        return {'error': str(e)}
+    finally:
+        # Empty MuPDF's shared store (fonts, images) between documents so a
+        # long-running worker does not keep every PDF's resources in memory
+        pymupdf.TOOLS.store_shrink(100)
+
+
+def process_pdfs(pdf_paths: list[Path], with_metadata: bool = True, max_workers: int | None = None, chunksize: int | None = None) -> list[dict]:
+    """
+    Process many PDFs in parallel worker processes.
+
+    Each PDF is independent (MuPDF decoding + regex cascade), so the batch is spread
+    over a process pool; the regex work is CPU-bound Python and does not scale with threads.
+    A PDF that fails does not abort the batch: its result is {'error': message}
+    (same message as str(e) in the notebook's extraction_errors).
+
+    Args:
+        pdf_paths: PDF files to process
+        with_metadata: Use process_pdf_with_metadata (True) or process_pdf_without_metadata (False)
+        max_workers: Number of worker processes (default None = os.cpu_count())
+        chunksize: PDFs sent to a worker per task (default None = about 4 tasks per worker,
+                   amortizes pickling overhead)
+
+    Returns:
+        One result dict per PDF, in the same order as pdf_paths
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(1, len(pdf_paths) // (max_workers * 4))
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_process_pdf_safe, pdf_paths, [with_metadata] * len(pdf_paths), chunksize=chunksize))
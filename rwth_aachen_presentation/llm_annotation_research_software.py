@@ -18,26 +18,39 @@ Usage:
     
     # Resume from checkpoint
     python llm_annotation_research_software.py --resume results/checkpoint_gpt-4o-mini_2026-01-21.csv
+    
+    # Full run via the OpenAI Batch API (results within 24 hours, lower cost)
+    python llm_annotation_research_software.py --batch
+    
+    # Collect the results of an interrupted --batch run
+    python llm_annotation_research_software.py --collect-batch results/batch_state_gpt-4o-mini_2026-01-21_18-00.json
 """
 
 
+from __future__ import annotations
+
 import json
 import os
 import base64
+import csv
+import hashlib
+import mmap
+import math
 import random
+import re
 import argparse
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-
-import pandas as pd
-from openai import OpenAI
-from dotenv import load_dotenv
-from tqdm import tqdm
+from typing import TYPE_CHECKING
 import time
 
-
-# Load environment variables
-load_dotenv()
+# pandas, openai, tqdm and dotenv are imported in the functions that use them,
+# so --help, --dry-run and argument errors do not wait for their import (~1 s)
+if TYPE_CHECKING:
+    import pandas as pd
+    from openai import OpenAI
 
 
 # =============================================================================
@@ -46,18 +59,26 @@ load_dotenv()
 
 # OpenAI settings (will be overridden by command-line args)
 DEFAULT_MODEL = "gpt-4o-mini"
-DEFAULT_TEMPERATURE = 0 # For reproducability
+DEFAULT_TEMPERATURE = 0.0 # For reproducability
 
 # Processing settings
 CHECKPOINT_FREQUENCY = 50  # Save progress every N PDFs
 MAX_RETRIES = 3  # Retry failed API calls
-RETRY_DELAY_SECONDS = 5  # Wait between retries
+RETRY_DELAY_SECONDS = 5  # Wait before the first retry (doubled for each further retry)
+MAX_RETRY_DELAY_SECONDS = 60  # Upper limit of the wait between retries
 MAX_CONSECUTIVE_ERRORS = 10  # Stop if this many errors in a row (circuit breaker)
+MAX_CONCURRENT_REQUESTS = 8  # API calls in flight at once (network-bound, so threads suffice)
 RANDOM_SEED = 42
 
+# Batch API settings (--batch)
+BATCH_POLL_SECONDS = 60  # Wait between batch status checks
+BATCH_MAX_FILE_BYTES = 190 * 1024 * 1024  # Split input JSONL files below the 200 MB upload limit
+
 # Paths
 DATA_DIR = Path("../data")
 RESULTS_DIR = Path("results")
+UPLOAD_CACHE_PATH = RESULTS_DIR / "uploaded_files.json"  # sha256 -> OpenAI file_id (--upload-files)
+RESULT_CACHE_PATH = RESULTS_DIR / "_hash_cache.json"  # model|temperature|prompt|sha256 -> classification result
 
 # LNI to year mapping
 LNI_MAPPING = {
@@ -128,6 +149,35 @@ JSON_SCHEMA_CONFIG = {
     "strict": True
 }
 
+# Static parts of every classification request (built once, shared by all requests)
+RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": JSON_SCHEMA_CONFIG
+}
+
+SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are an expert in classifying scientific journal articles. You will classify articles based on three criteria: research software presence, research software evaluation, and empirical study methodology."
+}
+
+PROMPT_TEXT_PART = {
+    "type": "text",
+    "text": "Classify this scientific journal article on three dimensions: "
+
+    "1. Research Software (label_research_software): Does the article contain research software? Research software includes source code files, algorithms, scripts, computational workflows and executables that were created during the research process or for a research purpose. (0 = contains no research software, 1 = contains research software)"
+
+    "2. Software Evaluation (label_software_evaluation): Does the article evaluate the research software? A key focus is, whether the quality characteristics of the software are evaluated. (0 = no evaluation, 1 = evaluates software)"
+
+    "3. Empirical Study (label_empirical_study): Is the article an empirical study where software serves as a means to conduct empirical research? Empirical research includes:"
+    "- hypothesis-testing empirical research with largely standardized steps and rules in the research process and the use of statistical methods"
+    "- descriptive empirical research with common steps and rules in the research process and the use of diverse analysis methods, including in the field"
+    "- intervening empirical research with variable steps and rules in the research process and the use of diverse analysis methods, including in the field"
+
+    "(0 = not an empirical study, 1 = is an empirical study)"
+
+    "For each classification, briefly explain your decision."
+}
+
 
 # =============================================================================
 # 2) PDF EXCLUSION 
@@ -160,6 +210,11 @@ FULL_PROCEEDINGS_SET = {
 # Terms to exclude (covers, prefaces, etc.)
 EXCLUSION_TERMS = ["cover", "vorwort", "preface", "foreword"]
 
+# Lookup forms of the two lists above, built once:
+# (folder, filename) keys avoid hashing full Path objects, and one regex replaces the term loop
+_FULL_PROCEEDINGS_KEYS = frozenset((path.parent.name, path.name) for path in FULL_PROCEEDINGS_SET)
+_RE_EXCLUSION_TERMS = re.compile("|".join(map(re.escape, EXCLUSION_TERMS)))
+
 
 def should_exclude_pdf(pdf_path: Path) -> bool:
     """
@@ -172,18 +227,27 @@ def should_exclude_pdf(pdf_path: Path) -> bool:
     Returns:
         True if PDF should be excluded, False otherwise
     """
-    # Check manual exclusion set
-    if pdf_path in FULL_PROCEEDINGS_SET:
+    # Check manual exclusion set (PDFs are always DATA_DIR/<lni folder>/<filename>)
+    if (pdf_path.parent.name, pdf_path.name) in _FULL_PROCEEDINGS_KEYS:
         return True
     
     # Check filename keywords (case-insensitive)
-    filename_lower = pdf_path.name.lower()
-    if any(term in filename_lower for term in EXCLUSION_TERMS):
+    if _RE_EXCLUSION_TERMS.search(pdf_path.name.lower()):
         return True
     
     return False
 
 
+def _scan_pdf_folder(folder: Path) -> list[Path]:
+    """
+    List the PDF files of one LNI folder, sorted by filename.
+    
+    os.scandir returns names without a stat call per entry (unlike Path.glob).
+    """
+    with os.scandir(folder) as entries:
+        return [folder / name for name in sorted(entry.name for entry in entries if entry.name.endswith(".pdf"))]
+
+
 def get_all_relevant_pdfs() -> list[tuple[Path, str, int]]:
     """
     Get all relevant PDF files for annotation.
@@ -191,20 +255,30 @@ def get_all_relevant_pdfs() -> list[tuple[Path, str, int]]:
     Returns:
         List of tuples: (pdf_path, lni_folder, year)
     """
-    pdf_list = []
+    # Collect known LNI folders first (sorted, so the PDF order is deterministic)
+    lni_folders = []
+    with os.scandir(DATA_DIR) as entries:
+        folder_names = sorted(entry.name for entry in entries if entry.is_dir() and entry.name.startswith("lni"))
     
-    for folder in sorted(DATA_DIR.iterdir()):
-        if folder.is_dir() and folder.name.startswith("lni"):
-            lni_folder = folder.name
-            year = LNI_MAPPING.get(lni_folder)
-            
-            if year is None:
-                print(f"WARNING: Unknown LNI folder '{lni_folder}', skipping...")
-                continue
-            
-            for pdf_path in sorted(folder.glob("*.pdf")):
-                if not should_exclude_pdf(pdf_path):
-                    pdf_list.append((pdf_path, lni_folder, year))
+    for lni_folder in folder_names:
+        year = LNI_MAPPING.get(lni_folder)
+        
+        if year is None:
+            print(f"WARNING: Unknown LNI folder '{lni_folder}', skipping...")
+            continue
+        
+        lni_folders.append((lni_folder, year))
+    
+    # Scan folders in parallel threads (directory listing is I/O-bound, e.g. on network drives);
+    # map() keeps the folder order
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        folder_pdfs = executor.map(_scan_pdf_folder, [DATA_DIR / lni_folder for lni_folder, _ in lni_folders])
+    
+    pdf_list = []
+    for (lni_folder, year), pdf_paths in zip(lni_folders, folder_pdfs):
+        for pdf_path in pdf_paths:
+            if not should_exclude_pdf(pdf_path):
+                pdf_list.append((pdf_path, lni_folder, year))
     
     return pdf_list
 
@@ -214,14 +288,132 @@ def get_all_relevant_pdfs() -> list[tuple[Path, str, int]]:
 # 3) CLASSIFICATION FUNCTION
 # =============================================================================
 
+def file_sha256(pdf_path: Path) -> str:
+    """
+    Compute the SHA-256 hex digest of a file (read in 1 MB chunks).
+    """
+    sha = hashlib.sha256()
+    with open(pdf_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
 
 
+def upload_pdfs(client: OpenAI, pdfs: dict[str, Path]) -> dict[str, str]:
+    """
+    Upload PDFs to the OpenAI Files API once and return their file IDs.
+    
+    Requests can then reference a PDF by file_id instead of inlining it as base64
+    (about 4/3 of the file size) in every call and retry. Uploads are cached in
+    UPLOAD_CACHE_PATH by content hash, so identical files are uploaded once and
+    later runs (e.g., --resume) reuse earlier uploads. Cached file IDs are
+    checked with files.retrieve first; files no longer on the account (deleted,
+    or the cache came from another API key) are uploaded again.
+    
+    Args:
+        client: OpenAI client instance
+        pdfs: Dict mapping content hash to a PDF with that content
+              (from group_pdfs_by_content)
+    
+    Returns:
+        Dict mapping content hash to file_id (PDFs whose upload failed are left
+        out and fall back to base64)
+    """
+    from openai import NotFoundError
+    from tqdm import tqdm
+    
+    cache = json.loads(UPLOAD_CACHE_PATH.read_text()) if UPLOAD_CACHE_PATH.exists() else {}
+    file_ids = {}
+    
+    for digest, pdf_path in tqdm(pdfs.items(), desc="Uploading PDFs", unit="pdf"):
+        if digest in cache:
+            try:
+                client.files.retrieve(cache[digest])
+            except NotFoundError:
+                del cache[digest]  # Stale entry: upload again below
+            except Exception as e:
+                tqdm.write(f"  WARNING: Could not check upload of {pdf_path.name} ({e}), sending it inline")
+                continue
+        if digest not in cache:
+            try:
+                with open(pdf_path, "rb") as f:
+                    cache[digest] = client.files.create(file=f, purpose="user_data").id
+            except Exception as e:
+                tqdm.write(f"  WARNING: Upload failed for {pdf_path.name} ({e}), sending it inline")
+                continue
+            # Save after every upload so a crash does not lose uploaded file IDs
+            UPLOAD_CACHE_PATH.write_text(json.dumps(cache, indent=2))
+        file_ids[digest] = cache[digest]
+    
+    return file_ids
+
+
+def build_classification_request(
+    pdf_path: Path,
+    model: str,
+    temperature: float,
+    file_id: str | None = None
+) -> dict:
+    """
+    Build the Chat Completions request body for one PDF.
+    
+    Used as keyword arguments for client.chat.completions.create() and as the
+    "body" of a Batch API request line.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        model: OpenAI model to use (e.g., "gpt-4o-mini")
+        temperature: Temperature for generation (0 for reproducibility)
+        file_id: ID of the uploaded PDF (see upload_pdfs); if None, the PDF is sent inline as base64
+    
+    Returns:
+        Request body dict (model, temperature, messages, response_format)
+    """
+    if file_id is not None:
+        # Reference the uploaded PDF
+        file_part = {"file_id": file_id}
+    else:
+        # Encode PDF as base64 (straight from the memory-mapped file, without
+        # first copying the whole file into a bytes object; an empty file
+        # cannot be mapped and is sent as an empty payload)
+        with open(pdf_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                pdf_data = ""
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    pdf_data = base64.b64encode(mm).decode("ascii")
+        file_part = {
+            "filename": pdf_path.name,
+            "file_data": f"data:application/pdf;base64,{pdf_data}"
+        }
+    
+    # Request with structured output (only the file part differs between PDFs)
+    return {
+        "model": model,
+        "temperature": temperature,
+        "messages": [
+            SYSTEM_MESSAGE,
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "file",
+                        "file": file_part
+                    },
+                    PROMPT_TEXT_PART
+                ]
+            }
+        ],
+        "response_format": RESPONSE_FORMAT
+    }
+
 
 def classify_pdf(
     client: OpenAI,
     pdf_path: Path,
     model: str,
-    temperature: float
+    temperature: float,
+    file_id: str | None = None
 ) -> dict:
     """
     Classify a single DeLFI paper for research software, evaluation, and empirical study.
@@ -231,6 +423,7 @@ def classify_pdf(
         pdf_path: Path to the PDF file
         model: OpenAI model to use (e.g., "gpt-4o-mini")
         temperature: Temperature for generation (0 for reproducibility)
+        file_id: ID of the uploaded PDF (optional, see upload_pdfs)
     
     Returns:
         Dict with keys:
@@ -242,63 +435,106 @@ def classify_pdf(
         - 'label_empirical_study_justification' (str)
         Or dict with 'error' key if classification failed
     """
-    # Encode PDF as base64
-    with open(pdf_path, "rb") as f:
-        pdf_data = base64.b64encode(f.read()).decode("utf-8")
-    
     # Call API with structured output
     response = client.chat.completions.create(
-        model=model,
-        temperature=temperature,
-        messages=[
-            {
-                "role": "system",
-                "content": "You are an expert in classifying scientific journal articles. You will classify articles based on three criteria: research software presence, research software evaluation, and empirical study methodology."
-            },
-            {
-                "role": "user",
-                "content": [
-                    {
-                        "type": "file",
-                        "file": {
-                            "filename": pdf_path.name,
-                            "file_data": f"data:application/pdf;base64,{pdf_data}"
-                        }
-                    },
-                    {
-                        "type": "text",
-                        "text": "Classify this scientific journal article on three dimensions: "
-
-                        "1. Research Software (label_research_software): Does the article contain research software? Research software includes source code files, algorithms, scripts, computational workflows and executables that were created during the research process or for a research purpose. (0 = contains no research software, 1 = contains research software)"
-                        
-                        "2. Software Evaluation (label_software_evaluation): Does the article evaluate the research software? A key focus is, whether the quality characteristics of the software are evaluated. (0 = no evaluation, 1 = evaluates software)"
-
-                        "3. Empirical Study (label_empirical_study): Is the article an empirical study where software serves as a means to conduct empirical research? Empirical research includes:"
-                        "- hypothesis-testing empirical research with largely standardized steps and rules in the research process and the use of statistical methods"
-                        "- descriptive empirical research with common steps and rules in the research process and the use of diverse analysis methods, including in the field"
-                        "- intervening empirical research with variable steps and rules in the research process and the use of diverse analysis methods, including in the field"
-                        
-                        "(0 = not an empirical study, 1 = is an empirical study)"
-
-                        "For each classification, briefly explain your decision."
-                    }
-                ]
-            }
-        ],
-        response_format={
-            "type": "json_schema",
-            "json_schema": JSON_SCHEMA_CONFIG
-        }
+        **build_classification_request(pdf_path, model, temperature, file_id)
     )
     
     return json.loads(response.choices[0].message.content)
 
+
+# Keys every classification result must contain, and the labels among them (0 or 1)
+_REQUIRED_KEYS = (
+    "label_research_software",
+    "label_research_software_justification",
+    "label_software_evaluation",
+    "label_software_evaluation_justification",
+    "label_empirical_study",
+    "label_empirical_study_justification",
+)
+_BINARY_KEYS = ("label_research_software", "label_software_evaluation", "label_empirical_study")
+
+
+def validate_classification(result: dict, pdf_path: Path) -> dict:
+    """
+    Validate a parsed classification response.
+    
+    Missing keys and labels outside 0/1 are set to None (with a warning).
+    
+    Args:
+        result: Parsed JSON response of the model
+        pdf_path: Path to the PDF file (for warnings)
+    
+    Returns:
+        The validated result dict (modified in place)
+    """
+    # Validate response structure
+    for key in _REQUIRED_KEYS:
+        if key not in result:
+            print(f"  WARNING: Missing '{key}' in response for {pdf_path.name}")
+            result[key] = None
+
+    # Validate binary values
+    for key in _BINARY_KEYS:
+        if result[key] not in [0, 1, None]:
+            print(f"  WARNING: Invalid '{key}' value: {result[key]} for {pdf_path.name}")
+            result[key] = None
+    
+    return result
+
+
+def failed_classification(error: str) -> dict:
+    """
+    Result for a PDF that could not be classified.
+    
+    Args:
+        error: Error message (stored in the status column)
+    
+    Returns:
+        Dict with all label/justification keys set to None and a 'failed: ...' status
+    """
+    return {**dict.fromkeys(_REQUIRED_KEYS), "status": f"failed: {error}"}
+
+
+def retry_delay(attempt: int, error: Exception) -> float:
+    """
+    Seconds to wait before retrying a failed API call.
+    
+    Exponential backoff (RETRY_DELAY_SECONDS, doubled per attempt, capped at
+    MAX_RETRY_DELAY_SECONDS) plus up to one second of jitter, so concurrent
+    workers do not retry in lockstep. For rate limit errors, the server's
+    Retry-After header is used instead if present (also capped at
+    MAX_RETRY_DELAY_SECONDS).
+    
+    Args:
+        attempt: Index of the failed attempt (0 for the first call)
+        error: Exception raised by the API call
+    
+    Returns:
+        Delay in seconds
+    """
+    from openai import RateLimitError
+    
+    if isinstance(error, RateLimitError):
+        retry_after = error.response.headers.get("retry-after")
+        try:
+            delay = float(retry_after)
+        except (TypeError, ValueError):
+            delay = None  # Header missing or an HTTP date: fall back to backoff
+        # Ignore bogus values (negative, inf, nan) that time.sleep would reject
+        if delay is not None and math.isfinite(delay) and delay >= 0:
+            return min(MAX_RETRY_DELAY_SECONDS, delay) + random.random()
+    
+    return min(MAX_RETRY_DELAY_SECONDS, RETRY_DELAY_SECONDS * 2 ** attempt) + random.random()
+
+
 def classify_pdf_with_retry(
     client: OpenAI,
     pdf_path: Path,
     model: str,
     temperature: float,
-    max_retries: int = MAX_RETRIES
+    max_retries: int = MAX_RETRIES,
+    file_id: str | None = None
 ) -> dict:
     """
     Classify PDF with retry logic and validation.
@@ -310,46 +546,9 @@ def classify_pdf_with_retry(
     
     for attempt in range(max_retries):
         try:
-            result = classify_pdf(client, pdf_path, model, temperature)
-            
-            # Validate response structure
-            if "label_research_software" not in result:
-                print(f"  WARNING: Missing 'label_research_software' in response for {pdf_path.name}")
-                result["label_research_software"] = None
-            
-            if "label_research_software_justification" not in result:
-                print(f"  WARNING: Missing 'label_research_software_justification' in response for {pdf_path.name}")
-                result["label_research_software_justification"] = None
-
-            if "label_software_evaluation" not in result:
-                print(f"  WARNING: Missing 'label_software_evaluation' in response for {pdf_path.name}")
-                result["label_software_evaluation"] = None
-
-            if "label_software_evaluation_justification" not in result:
-                print(f"  WARNING: Missing 'label_software_evaluation_justification' in response for {pdf_path.name}")
-                result["label_software_evaluation_justification"] = None
-
-            if "label_empirical_study" not in result:
-                print(f"  WARNING: Missing 'label_empirical_study' in response for {pdf_path.name}")
-                result["label_empirical_study"] = None
-
-            if "label_empirical_study_justification" not in result:
-                print(f"  WARNING: Missing 'label_empirical_study_justification' in response for {pdf_path.name}")
-                result["label_empirical_study_justification"] = None
-            
-            # Validate binary values
-            if result["label_research_software"] not in [0, 1, None]:
-                print(f"  WARNING: Invalid 'label_research_software' value: {result['label_research_software']} for {pdf_path.name}")
-                result["label_research_software"] = None
-
-            if result["label_software_evaluation"] not in [0, 1, None]:
-                print(f"  WARNING: Invalid 'label_software_evaluation' value: {result['label_software_evaluation']} for {pdf_path.name}")
-                result["label_software_evaluation"] = None
-
-            if result["label_empirical_study"] not in [0, 1, None]:
-                print(f"  WARNING: Invalid 'label_empirical_study' value: {result['label_empirical_study']} for {pdf_path.name}")
-                result["label_empirical_study"] = None
+            result = classify_pdf(client, pdf_path, model, temperature, file_id)
             
+            result = validate_classification(result, pdf_path)
             result["status"] = "success"
             return result
             
@@ -358,54 +557,54 @@ def classify_pdf_with_retry(
             print(f"  ERROR (attempt {attempt + 1}/{max_retries}): {pdf_path.name} - {last_error}")
             
             if attempt < max_retries - 1:
-                time.sleep(RETRY_DELAY_SECONDS)
+                time.sleep(retry_delay(attempt, e))
     
     # All retries failed
-    return {
-        "label_research_software": None,
-        "label_research_software_justification": None,
-        "label_software_evaluation": None,
-        "label_software_evaluation_justification": None,
-        "label_empirical_study": None,
-        "label_empirical_study_justification": None,
-        "status": f"failed: {last_error}"
-    }
+    return failed_classification(last_error)
 
 
 # =============================================================================
 # 4) MAIN PROCESSING LOOP
 # =============================================================================
 
-def process_pdfs(
+def create_client() -> OpenAI:
+    """
+    Create the OpenAI client from the OPENAI_API_KEY environment variable.
+    
+    Returns:
+        OpenAI client instance
+    """
+    from dotenv import load_dotenv
+    from openai import OpenAI
+    
+    # Load environment variables
+    load_dotenv()
+    
+    openai_api_key = os.getenv("OPENAI_API_KEY")
+    if not openai_api_key:
+        raise ValueError("OPENAI_API_KEY not found in environment variables")
+    return OpenAI(api_key=openai_api_key)
+
+
+def select_pdfs_to_process(
     pdf_list: list[tuple[Path, str, int]],
-    model: str,
-    temperature: float,
     checkpoint_path: Path | None = None,
     test_mode: bool = False,
     test_sample_size: int = 50
-) -> pd.DataFrame:
+) -> tuple[list[dict], list[tuple[Path, str, int]]]:
     """
-    Process all PDFs and return results as DataFrame.
+    Load a checkpoint (if given) and select the PDFs that still need annotation.
     
     Args:
         pdf_list: List of (pdf_path, lni_folder, year) tuples
-        model: OpenAI model to use
-        temperature: Temperature for generation
         checkpoint_path: Path to existing checkpoint to resume from (optional)
-        test_mode: If True, only process a random sample
+        test_mode: If True, only select a random sample
         test_sample_size: Number of samples for test mode
     
     Returns:
-        DataFrame with annotation results
+        Tuple of (records loaded from the checkpoint, PDFs to process)
     """
-    # Initialize OpenAI client
-    openai_api_key = os.getenv("OPENAI_API_KEY")
-    if not openai_api_key:
-        raise ValueError("OPENAI_API_KEY not found in environment variables")
-    client = OpenAI(api_key=openai_api_key)
-    
-    # Create results directory
-    RESULTS_DIR.mkdir(exist_ok=True)
+    import pandas as pd
     
     # Load existing checkpoint if provided
     processed_files = set()
@@ -433,11 +632,213 @@ def process_pdfs(
         else:
             print(f"\nTEST MODE: Processing all {len(pdfs_to_process)} remaining PDFs (less than sample size)")
     
+    return results, pdfs_to_process
+
+
+def group_pdfs_by_content(
+    pdfs_to_process: list[tuple[Path, str, int]]
+) -> dict[str, list[tuple[Path, str, int]]]:
+    """
+    Group PDFs by SHA-256, so byte-identical files (e.g., the same paper in an
+    lni folder and its _Onlineversion) are classified only once.
+    
+    Args:
+        pdfs_to_process: List of (pdf_path, lni_folder, year) tuples
+    
+    Returns:
+        Dict mapping the content hash to all PDFs with that content (in input order)
+    """
+    from tqdm import tqdm
+    
+    groups = {}
+    for pdf_entry in tqdm(pdfs_to_process, desc="Hashing PDFs", unit="pdf"):
+        groups.setdefault(file_sha256(pdf_entry[0]), []).append(pdf_entry)
+    return groups
+
+
+# Fingerprint of the static request parts: editing the prompt, system message
+# or JSON schema changes it, so results cached with an older prompt are not reused
+_PROMPT_FINGERPRINT = hashlib.sha256(
+    json.dumps([SYSTEM_MESSAGE, PROMPT_TEXT_PART, RESPONSE_FORMAT], sort_keys=True).encode("utf-8")
+).hexdigest()[:16]
+
+
+def result_cache_key(digest: str, model: str, temperature: float) -> str:
+    """
+    Key of a classification result in RESULT_CACHE_PATH (a result is only
+    reused for the same PDF content, model, temperature and prompt).
+    
+    The temperature is formatted as a float, so 0 and 0.0 give the same key.
+    """
+    return f"{model}|{float(temperature)}|{_PROMPT_FINGERPRINT}|{digest}"
+
+
+def load_result_cache() -> dict[str, dict]:
+    """
+    Load successful classification results of earlier runs (empty if none).
+    """
+    return json.loads(RESULT_CACHE_PATH.read_text()) if RESULT_CACHE_PATH.exists() else {}
+
+
+def save_result_cache(cache: dict[str, dict]) -> None:
+    """
+    Save the classification result cache (written to a temporary file first,
+    so an interrupted write does not corrupt the cache).
+    """
+    tmp_path = RESULT_CACHE_PATH.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(cache, indent=2, ensure_ascii=False), encoding="utf-8")
+    tmp_path.replace(RESULT_CACHE_PATH)
+
+
+def split_cached_pdfs(
+    pdfs_to_process: list[tuple[Path, str, int]],
+    cache: dict[str, dict],
+    model: str,
+    temperature: float,
+    use_cache: bool = True
+) -> tuple[dict[str, list[tuple[Path, str, int]]], dict[str, list[tuple[Path, str, int]]]]:
+    """
+    Group PDFs by content and split off those with a cached result.
+    
+    Args:
+        pdfs_to_process: List of (pdf_path, lni_folder, year) tuples
+        cache: Result cache (see load_result_cache())
+        model: OpenAI model to use
+        temperature: Temperature for generation
+        use_cache: If False, cached results are ignored (every PDF content is classified)
+    
+    Returns:
+        Tuple of (groups to classify, groups with a cached result), each mapping
+        the content hash to its PDFs
+    """
+    pending_groups, cached_groups = {}, {}
+    for digest, group in group_pdfs_by_content(pdfs_to_process).items():
+        if use_cache and result_cache_key(digest, model, temperature) in cache:
+            cached_groups[digest] = group
+        else:
+            pending_groups[digest] = group
+    
+    duplicates = len(pdfs_to_process) - len(pending_groups) - len(cached_groups)
+    print(f"Unique PDF contents: {len(pending_groups) + len(cached_groups)} "
+          f"({duplicates} duplicate files, {len(cached_groups)} with a cached result)")
+    return pending_groups, cached_groups
+
+
+# Columns of the result records / checkpoint CSV (keys of build_record())
+RECORD_FIELDS = [
+    "lni_edition",
+    "year",
+    "filename",
+    "label_research_software",
+    "label_research_software_justification",
+    "label_software_evaluation",
+    "label_software_evaluation_justification",
+    "label_empirical_study",
+    "label_empirical_study_justification",
+    "status",
+]
+
+
+def build_record(result: dict, pdf_path: Path, lni_folder: str, year: int) -> dict:
+    """
+    Build the result record (one CSV row) for a classified PDF.
+    
+    Args:
+        result: Validated classification result (or failed_classification())
+        pdf_path: Path to the PDF file
+        lni_folder: LNI folder name
+        year: Publication year
+    
+    Returns:
+        Record dict
+    """
+    return {
+        "lni_edition": lni_folder,
+        "year": year,
+        "filename": pdf_path.name,
+        "label_research_software": result["label_research_software"],
+        "label_research_software_justification": result["label_research_software_justification"],
+        "label_software_evaluation": result["label_software_evaluation"],
+        "label_software_evaluation_justification": result["label_software_evaluation_justification"],
+        "label_empirical_study": result["label_empirical_study"],
+        "label_empirical_study_justification": result["label_empirical_study_justification"],
+        "status": result["status"]
+    }
+
+
+def print_processing_summary(results: list[dict]) -> None:
+    """
+    Print counts of successful and failed annotations and list the failed files.
+    """
+    print("\n" + "=" * 60)
+    print("PROCESSING SUMMARY")
+    print("=" * 60)
+    success_count = sum(1 for r in results if r["status"] == "success")
+    failed_count = len(results) - success_count
+    print(f"Total processed: {len(results)}")
+    print(f"  Successful: {success_count}")
+    print(f"  Failed: {failed_count}")
+    
+    if failed_count > 0:
+        print("\nFailed files:")
+        for r in results:
+            if r["status"] != "success":
+                print(f"  - {r['filename']}: {r['status']}")
+
+
+def process_pdfs(
+    pdf_list: list[tuple[Path, str, int]],
+    model: str,
+    temperature: float,
+    checkpoint_path: Path | None = None,
+    test_mode: bool = False,
+    test_sample_size: int = 50,
+    max_workers: int = MAX_CONCURRENT_REQUESTS,
+    upload_files: bool = False,
+    use_cache: bool = True
+) -> pd.DataFrame:
+    """
+    Process all PDFs and return results as DataFrame.
+    
+    Args:
+        pdf_list: List of (pdf_path, lni_folder, year) tuples
+        model: OpenAI model to use
+        temperature: Temperature for generation
+        checkpoint_path: Path to existing checkpoint to resume from (optional)
+        test_mode: If True, only process a random sample
+        test_sample_size: Number of samples for test mode
+        max_workers: Number of concurrent API calls
+        upload_files: If True, upload PDFs once and reference them by file_id
+        use_cache: If False, results cached by earlier runs are not reused
+    
+    Returns:
+        DataFrame with annotation results
+    """
+    import pandas as pd
+    from tqdm import tqdm
+    
+    # Initialize OpenAI client
+    client = create_client()
+    
+    # Create results directory
+    RESULTS_DIR.mkdir(exist_ok=True)
+    
+    # Load existing checkpoint (if provided) and select PDFs
+    results, pdfs_to_process = select_pdfs_to_process(pdf_list, checkpoint_path, test_mode, test_sample_size)
+    
     print(f"\nProcessing {len(pdfs_to_process)} PDFs...")
     print(f"Model: {model}, Temperature: {temperature}")
+    print(f"Concurrent requests: {max_workers}")
     print(f"Checkpoint every {CHECKPOINT_FREQUENCY} files")
     print(f"Circuit breaker: {MAX_CONSECUTIVE_ERRORS} consecutive errors\n")
     
+    # Classify each PDF content once; reuse results of earlier runs
+    cache = load_result_cache()
+    pending_groups, cached_groups = split_cached_pdfs(pdfs_to_process, cache, model, temperature, use_cache)
+    
+    # Upload PDFs once (retries then only resend the file_id)
+    file_ids = upload_pdfs(client, {digest: group[0][0] for digest, group in pending_groups.items()}) if upload_files else {}
+    
     # Generate checkpoint filename for this run (with hour-minute for uniqueness)
     timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M")
     checkpoint_filename = f"checkpoint_{model}_{timestamp}.csv"
@@ -447,75 +848,374 @@ def process_pdfs(
     consecutive_errors = 0
     processed_count = 0
     
+    # The checkpoint is written append-only: header and resumed records once, then
+    # one row per classified PDF (instead of rewriting the whole file every N PDFs).
+    # Columns of an older checkpoint are kept, new columns are added.
+    fieldnames = list(dict.fromkeys([*(results[0].keys() if results else []), *RECORD_FIELDS]))
+    
     # Main processing loop with progress bar
-    with tqdm(pdfs_to_process, desc="Annotating PDFs", unit="pdf") as pbar:
-        for pdf_path, lni_folder, year in pbar:
-            # Update progress bar description
-            pbar.set_postfix_str(f"{pdf_path.name[:30]}...")
+    # Each PDF is an independent API call that mostly waits on the network,
+    # so several calls run in a thread pool and are recorded as they complete
+    with (
+        open(current_checkpoint_path, "w", newline="", encoding="utf-8") as checkpoint_file,
+        ThreadPoolExecutor(max_workers=max_workers) as executor,
+        tqdm(total=len(pdfs_to_process), desc="Annotating PDFs", unit="pdf") as pbar,
+    ):
+        pd.DataFrame(results, columns=fieldnames).to_csv(checkpoint_file, index=False, lineterminator="\n")
+        checkpoint_writer = csv.DictWriter(checkpoint_file, fieldnames=fieldnames, lineterminator="\n")
+        
+        # One preallocated slot per PDF (after the resumed records), so the results keep
+        # the input order although API calls complete in any order (the checkpoint is
+        # appended in completion order)
+        recorded_count = len(results)
+        slots = {pdf_path: recorded_count + i for i, (pdf_path, _, _) in enumerate(pdfs_to_process)}
+        results.extend([None] * len(pdfs_to_process))
+        
+        # PDFs with a cached result are recorded without an API call
+        for digest, group in cached_groups.items():
+            result = cache[result_cache_key(digest, model, temperature)]
+            for pdf_path, lni_folder, year in group:
+                record = build_record(result, pdf_path, lni_folder, year)
+                results[slots[pdf_path]] = record
+                checkpoint_writer.writerow(record)
+                recorded_count += 1
+            pbar.update(len(group))
+        checkpoint_file.flush()
+        
+        # One API call per PDF content (the first PDF of each group is sent)
+        futures = {
+            executor.submit(
+                classify_pdf_with_retry, client, group[0][0], model, temperature, file_id=file_ids.get(digest)
+            ): digest
+            for digest, group in pending_groups.items()
+        }
+
+        # On Ctrl-C or an error while recording, drop the queued PDFs: leaving the
+        # with-block would otherwise wait until every queued API call has run
+        try:
+            for future in as_completed(futures):
+                digest = futures[future]
+                group = pending_groups[digest]
+
+                # Update progress bar description
+                pbar.set_postfix_str(f"{group[0][0].name[:30]}...")
+                pbar.update(len(group))
+                
+                # Classification result (classify_pdf_with_retry does not raise)
+                result = future.result()
+                
+                # Build one record per PDF with this content and append them to the checkpoint
+                # (flushed per result, so an interrupted run never leaves half a line)
+                for pdf_path, lni_folder, year in group:
+                    record = build_record(result, pdf_path, lni_folder, year)
+                    results[slots[pdf_path]] = record
+                    checkpoint_writer.writerow(record)
+                    recorded_count += 1
+                checkpoint_file.flush()
+                processed_count += 1
+                
+                # Track consecutive errors for circuit breaker
+                if result["status"] != "success":
+                    consecutive_errors += 1
+                    if consecutive_errors >= MAX_CONSECUTIVE_ERRORS:
+                        print(f"\n\nCIRCUIT BREAKER: {MAX_CONSECUTIVE_ERRORS} consecutive errors reached!")
+                        print("Stopping processing. Check your API key, network, or the PDF files.")
+                        print(f"Saving checkpoint before exit...\n")
+                        # Drop queued PDFs (calls already running still finish, but are not recorded)
+                        for pending in futures:
+                            pending.cancel()
+                        break
+                else:
+                    consecutive_errors = 0  # Reset on success
+                    cache[result_cache_key(digest, model, temperature)] = result
+                
+                # Sync checkpoint and result cache to disk periodically
+                if processed_count % CHECKPOINT_FREQUENCY == 0:
+                    os.fsync(checkpoint_file.fileno())
+                    save_result_cache(cache)
+                    tqdm.write(f"  [Checkpoint saved: {recorded_count} records -> {current_checkpoint_path}]")
+        except BaseException:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+    
+    save_result_cache(cache)
+    
+    # Drop the empty slots of PDFs skipped by the circuit breaker
+    results = [record for record in results if record is not None]
+    
+    # Final results (the checkpoint file already contains every record)
+    final_df = pd.DataFrame(results)
+    print(f"\nFinal checkpoint saved: {current_checkpoint_path}")
+    
+    # Print summary
+    print_processing_summary(results)
+    
+    return final_df
+
+
+def parse_batch_output(entry: dict | None, pdf_path: Path) -> dict:
+    """
+    Turn one line of a Batch API output/error file into a classification result.
+    
+    Args:
+        entry: Parsed output line for the PDF (None if the batch returned nothing for it)
+        pdf_path: Path to the PDF file (for warnings)
+    
+    Returns:
+        Validated result with status "success", or failed_classification()
+    """
+    if entry is None:
+        return failed_classification("no result in batch output")
+    
+    response = entry.get("response")
+    if entry.get("error") or response is None or response.get("status_code") != 200:
+        error = entry.get("error") or (response or {}).get("body", {}).get("error")
+        if isinstance(error, dict):
+            error = error.get("message", error)
+        return failed_classification(error)
+    
+    try:
+        result = json.loads(response["body"]["choices"][0]["message"]["content"])
+    except (KeyError, IndexError, TypeError, json.JSONDecodeError) as e:
+        return failed_classification(f"unreadable batch response ({e})")
+    
+    result = validate_classification(result, pdf_path)
+    result["status"] = "success"
+    return result
+
+
+def process_pdfs_batch(
+    pdf_list: list[tuple[Path, str, int]],
+    model: str,
+    temperature: float,
+    checkpoint_path: Path | None = None,
+    test_mode: bool = False,
+    test_sample_size: int = 50,
+    upload_files: bool = False,
+    use_cache: bool = True
+) -> pd.DataFrame:
+    """
+    Process all PDFs through the OpenAI Batch API and return results as DataFrame.
+    
+    All requests are written to JSONL files and uploaded; OpenAI runs them
+    asynchronously within 24 hours at a lower price than synchronous calls.
+    The function waits until all batches have finished and then collects the
+    results (same columns as process_pdfs()).
+    
+    The submitted batches are recorded in a batch state file in RESULTS_DIR
+    before polling starts. If the run is interrupted, the results can be
+    collected later with collect_batch_results() (--collect-batch) instead of
+    submitting (and paying for) the requests again.
+    
+    Args:
+        pdf_list: List of (pdf_path, lni_folder, year) tuples
+        model: OpenAI model to use
+        temperature: Temperature for generation
+        checkpoint_path: Path to existing checkpoint to resume from (optional)
+        test_mode: If True, only process a random sample
+        test_sample_size: Number of samples for test mode
+        upload_files: If True, upload PDFs once and reference them by file_id
+                      (keeps the batch input files small)
+        use_cache: If False, results cached by earlier runs are not reused
+    
+    Returns:
+        DataFrame with annotation results
+    """
+    import pandas as pd
+    from tqdm import tqdm
+    
+    # Initialize OpenAI client
+    client = create_client()
+    
+    # Create results directory
+    RESULTS_DIR.mkdir(exist_ok=True)
+    
+    # Load existing checkpoint (if provided) and select PDFs
+    results, pdfs_to_process = select_pdfs_to_process(pdf_list, checkpoint_path, test_mode, test_sample_size)
+    
+    # Classify each PDF content once; reuse results of earlier runs
+    cache = load_result_cache()
+    pending_groups, cached_groups = split_cached_pdfs(pdfs_to_process, cache, model, temperature, use_cache)
+    for digest, group in cached_groups.items():
+        result = cache[result_cache_key(digest, model, temperature)]
+        results.extend(build_record(result, pdf_path, lni_folder, year) for pdf_path, lni_folder, year in group)
+    
+    # Upload PDFs once (request lines then only contain the file_id)
+    file_ids = upload_pdfs(client, {digest: group[0][0] for digest, group in pending_groups.items()}) if upload_files else {}
+    
+    print(f"\nSubmitting {len(pending_groups)} PDFs to the Batch API...")
+    print(f"Model: {model}, Temperature: {temperature}\n")
+    
+    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M")
+    
+    # Write one request line per PDF content; custom_id includes the LNI folder
+    # since filenames repeat across folders
+    requests_by_id = {}
+    input_paths = []
+    input_file = None
+    input_size = 0
+    try:
+        for digest, group in tqdm(pending_groups.items(), desc="Writing batch input", unit="pdf"):
+            pdf_path, lni_folder, _ = group[0]
+            custom_id = f"{lni_folder}/{pdf_path.name}"
+            line = json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": build_classification_request(pdf_path, model, temperature, file_ids.get(digest))
+            }) + "\n"
+            line_size = len(line.encode("utf-8"))
             
-            # Classify the PDF
-            result = classify_pdf_with_retry(client, pdf_path, model, temperature)
+            # Start a new input file when the current one would exceed the upload limit
+            if input_file is None or input_size + line_size > BATCH_MAX_FILE_BYTES:
+                if input_file is not None:
+                    input_file.close()
+                input_path = RESULTS_DIR / f"batch_input_{model}_{timestamp}_{len(input_paths) + 1}.jsonl"
+                input_file = open(input_path, "w", encoding="utf-8")
+                input_paths.append(input_path)
+                input_size = 0
             
-            # Build result record
-            record = {
-                "lni_edition": lni_folder,
-                "year": year,
-                "filename": pdf_path.name,
-                "label_research_software": result["label_research_software"],
-                "label_research_software_justification": result["label_research_software_justification"],
-                "label_software_evaluation": result["label_software_evaluation"],
-                "label_software_evaluation_justification": result["label_software_evaluation_justification"],
-                "label_empirical_study": result["label_empirical_study"],
-                "label_empirical_study_justification": result["label_empirical_study_justification"],
-                "status": result["status"]
+            input_file.write(line)
+            input_size += line_size
+            requests_by_id[custom_id] = digest
+    finally:
+        if input_file is not None:
+            input_file.close()
+    
+    # Batch state: everything needed to collect the results later (saved again
+    # after each submitted batch, so no paid batch is lost if the run is interrupted)
+    state_path = RESULTS_DIR / f"batch_state_{model}_{timestamp}.json"
+    state = {
+        "model": model,
+        "temperature": temperature,
+        "test_mode": test_mode,
+        "timestamp": timestamp,
+        "batch_ids": [],
+        # custom_id -> content hash and all PDFs with that content
+        "requests": {
+            custom_id: {
+                "digest": digest,
+                "pdfs": [[str(pdf_path), lni_folder, year] for pdf_path, lni_folder, year in pending_groups[digest]]
             }
-            results.append(record)
-            processed_count += 1
-            
-            # Track consecutive errors for circuit breaker
-            if result["status"] != "success":
-                consecutive_errors += 1
-                if consecutive_errors >= MAX_CONSECUTIVE_ERRORS:
-                    print(f"\n\nCIRCUIT BREAKER: {MAX_CONSECUTIVE_ERRORS} consecutive errors reached!")
-                    print("Stopping processing. Check your API key, network, or the PDF files.")
-                    print(f"Saving checkpoint before exit...\n")
-                    break
-            else:
-                consecutive_errors = 0  # Reset on success
-            
-            # Save checkpoint periodically
-            if processed_count % CHECKPOINT_FREQUENCY == 0:
-                checkpoint_df = pd.DataFrame(results)
-                checkpoint_df.to_csv(current_checkpoint_path, index=False)
-                tqdm.write(f"  [Checkpoint saved: {len(results)} records -> {current_checkpoint_path}]")
+            for custom_id, digest in requests_by_id.items()
+        },
+        # Records that need no batch request (resumed checkpoint, cached results)
+        "records": results
+    }
+    save_batch_state(state_path, state)
+    
+    # Upload input files and create one batch per file
+    for input_path in input_paths:
+        with open(input_path, "rb") as f:
+            uploaded = client.files.create(file=f, purpose="batch")
+        batch = client.batches.create(
+            input_file_id=uploaded.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        state["batch_ids"].append(batch.id)
+        save_batch_state(state_path, state)
+        print(f"  Submitted {input_path.name} as batch {batch.id}")
+    
+    print(f"\nBatch state saved: {state_path}")
+    print(f"If this run is interrupted, collect the results with --collect-batch {state_path}\n")
+    
+    return collect_batch_results(state_path, client)
+
+
+def save_batch_state(state_path: Path, state: dict) -> None:
+    """
+    Save the batch state of a --batch run (written to a temporary file first,
+    so an interrupted write does not corrupt it).
+    """
+    tmp_path = state_path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(state, indent=2, ensure_ascii=False), encoding="utf-8")
+    tmp_path.replace(state_path)
+
+
+def load_batch_state(state_path: Path) -> dict:
+    """
+    Load the batch state file written by process_pdfs_batch().
+    """
+    return json.loads(state_path.read_text(encoding="utf-8"))
+
+
+def collect_batch_results(state_path: Path, client: OpenAI | None = None) -> pd.DataFrame:
+    """
+    Wait for the batches of a batch state file and collect their results.
     
-    # Final save
-    final_df = pd.DataFrame(results)
+    Called by process_pdfs_batch() after submitting, and with --collect-batch
+    to finish an interrupted --batch run without submitting the requests again.
+    
+    Args:
+        state_path: Batch state file written by process_pdfs_batch()
+        client: OpenAI client instance (created if None)
     
-    # Save checkpoint one more time (in case we didn't hit a checkpoint interval)
+    Returns:
+        DataFrame with annotation results (same columns as process_pdfs())
+    """
+    import pandas as pd
+    from tqdm import tqdm
+    
+    if client is None:
+        client = create_client()
+    
+    state = load_batch_state(state_path)
+    model = state["model"]
+    temperature = state["temperature"]
+    batch_ids = state["batch_ids"]
+    results = state["records"]
+    
+    # Poll until every batch has reached a final status
+    finished = {}
+    while True:
+        for batch_id in batch_ids:
+            if batch_id in finished:
+                continue
+            batch = client.batches.retrieve(batch_id)
+            counts = batch.request_counts
+            tqdm.write(f"  [{datetime.now():%H:%M}] {batch_id}: {batch.status}"
+                       + (f" ({counts.completed + counts.failed}/{counts.total})" if counts else ""))
+            if batch.status in ("completed", "failed", "expired", "cancelled"):
+                finished[batch_id] = batch
+        if len(finished) == len(batch_ids):
+            break
+        time.sleep(BATCH_POLL_SECONDS)
+    
+    # Collect results from output and error files
+    entries = {}
+    for batch in finished.values():
+        if batch.status != "completed":
+            print(f"WARNING: Batch {batch.id} ended with status '{batch.status}'")
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if file_id is None:
+                continue
+            for line in client.files.content(file_id).text.splitlines():
+                if line.strip():
+                    entry = json.loads(line)
+                    entries[entry["custom_id"]] = entry
+    
+    cache = load_result_cache()
+    for custom_id, request in state["requests"].items():
+        group = [(Path(pdf_path), lni_folder, year) for pdf_path, lni_folder, year in request["pdfs"]]
+        result = parse_batch_output(entries.get(custom_id), group[0][0])
+        results.extend(build_record(result, pdf_path, lni_folder, year) for pdf_path, lni_folder, year in group)
+        if result["status"] == "success":
+            cache[result_cache_key(request["digest"], model, temperature)] = result
+    save_result_cache(cache)
+    
+    # Save checkpoint (same format as process_pdfs(), usable with --resume)
+    final_df = pd.DataFrame(results)
+    current_checkpoint_path = RESULTS_DIR / f"checkpoint_{model}_{state['timestamp']}.csv"
     final_df.to_csv(current_checkpoint_path, index=False)
     print(f"\nFinal checkpoint saved: {current_checkpoint_path}")
     
     # Print summary
-    print("\n" + "=" * 60)
-    print("PROCESSING SUMMARY")
-    print("=" * 60)
-    success_count = sum(1 for r in results if r["status"] == "success")
-    failed_count = len(results) - success_count
-    print(f"Total processed: {len(results)}")
-    print(f"  Successful: {success_count}")
-    print(f"  Failed: {failed_count}")
-    
-    if failed_count > 0:
-        print("\nFailed files:")
-        for r in results:
-            if r["status"] != "success":
-                print(f"  - {r['filename']}: {r['status']}")
+    print_processing_summary(results)
     
     return final_df
 
 
-
 # =============================================================================
 # 5) RESULTS SAVING
 # =============================================================================
@@ -535,6 +1235,8 @@ def save_final_results(df: pd.DataFrame, model: str, test_mode: bool = False) ->
     Returns:
         Path to saved CSV file
     """
+    import pandas as pd
+    
     # Create results directory if needed
     RESULTS_DIR.mkdir(exist_ok=True)
     
@@ -552,11 +1254,15 @@ def save_final_results(df: pd.DataFrame, model: str, test_mode: bool = False) ->
     
     # Print label distribution
     if "label_research_software" in df.columns:
-        label_counts = df["label_research_software"].value_counts(dropna=False)
+        # Counts per label (failed annotations are NaN and listed last)
+        label_counts = df["label_research_software"].value_counts(dropna=False).sort_index(na_position="last")
+        label_pcts = label_counts / len(df) * 100
+        label_names = label_counts.index.map(
+            lambda label: "Failed/Missing" if pd.isna(label)
+            else {0: "No research software", 1: "Contains research software"}.get(label, label)
+        )
         print(f"\nLabel distribution:")
-        for label, count in sorted(label_counts.items(), key=lambda x: (x[0] is None, x[0])):
-            label_name = {0: "No research software", 1: "Contains research software", None: "Failed/Missing"}.get(label, label)
-            pct = count / len(df) * 100
+        for label_name, count, pct in zip(label_names, label_counts, label_pcts):
             print(f"  {label_name}: {count} ({pct:.1f}%)")
     
     return filepath
@@ -568,23 +1274,27 @@ def print_yearly_summary(df: pd.DataFrame) -> None:
     
     Shows: count, mean label, std for each year.
     """
+    import pandas as pd
+    
     print("\n" + "=" * 70)
     print("YEARLY SUMMARY (for visualization prep)")
     print("=" * 70)
     
-    # Filter to successful annotations only
-    df_valid = df[df["label_research_software"].notna()].copy()
+    # Successful annotations only (selected by mask, without copying the whole frame)
+    labels = df["label_research_software"]
+    valid = labels.notna()
+    labels_valid = labels[valid]
     
-    if len(df_valid) == 0:
+    if len(labels_valid) == 0:
         print("No valid annotations to summarize.")
         return
     
-    # Group by year
-    yearly_stats = df_valid.groupby("year").agg(
-        n_papers=("label_research_software", "count"),
-        mean_label=("label_research_software", "mean"),
-        std_label=("label_research_software", "std"),
-        sum_research_sw=("label_research_software", "sum")
+    # Group by year (all statistics in one aggregation over the label column)
+    yearly_stats = labels_valid.groupby(df.loc[valid, "year"]).agg(
+        n_papers="count",
+        mean_label="mean",
+        std_label="std",
+        sum_research_sw="sum"
     ).round(3)
     
     print(f"\n{'Year':<6} {'Papers':<8} {'With RS':<10} {'Mean':<8} {'Std':<8}")
@@ -595,10 +1305,10 @@ def print_yearly_summary(df: pd.DataFrame) -> None:
         print(f"{year:<6} {int(row['n_papers']):<8} {int(row['sum_research_sw']):<10} {row['mean_label']:.3f}    {std_str}")
     
     print("-" * 50)
-    total = len(df_valid)
-    total_rs = int(df_valid["label_research_software"].sum())
-    overall_mean = df_valid["label_research_software"].mean()
-    overall_std = df_valid["label_research_software"].std()
+    total = len(labels_valid)
+    total_rs = int(labels_valid.sum())
+    overall_mean = labels_valid.mean()
+    overall_std = labels_valid.std()
     print(f"{'TOTAL':<6} {total:<8} {total_rs:<10} {overall_mean:.3f}    {overall_std:.3f}")
 
 
@@ -634,6 +1344,24 @@ Examples:
   # Resume from checkpoint
   python llm_annotation_research_software.py --resume results/checkpoint_gpt-4o-mini_2026-01-21.csv
   
+  # More concurrent API calls (mind your rate limit tier)
+  python llm_annotation_research_software.py --workers 16
+  
+  # Full run via the Batch API (waits until OpenAI has processed all requests)
+  python llm_annotation_research_software.py --batch
+  
+  # Collect the results of an interrupted --batch run
+  python llm_annotation_research_software.py --collect-batch results/batch_state_gpt-4o-mini_2026-01-21_18-00.json
+  
+  # Upload PDFs once instead of sending them inline with every request
+  python llm_annotation_research_software.py --batch --upload-files
+  
+  # Full run without the confirmation prompt
+  python llm_annotation_research_software.py --yes
+  
+  # Ignore results cached by earlier runs
+  python llm_annotation_research_software.py --test --no-cache
+  
   # Combine options
   python llm_annotation_research_software.py --model gpt-4o --temperature 0.1 --resume results/checkpoint.csv
         """
@@ -673,6 +1401,48 @@ Examples:
         help="Path to checkpoint CSV file to resume from"
     )
     
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=MAX_CONCURRENT_REQUESTS,
+        help=f"Number of concurrent API calls (default: {MAX_CONCURRENT_REQUESTS})"
+    )
+    
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Submit all requests via the OpenAI Batch API (lower cost, results within 24 hours)"
+    )
+    
+    parser.add_argument(
+        "--collect-batch",
+        type=str,
+        default=None,
+        metavar="STATE_FILE",
+        help="Collect the results of an interrupted --batch run from its batch state file "
+             "(results/batch_state_*.json) without submitting the requests again"
+    )
+    
+    parser.add_argument(
+        "--upload-files",
+        action="store_true",
+        help=f"Upload each PDF once and reference it by file ID instead of sending it as base64 "
+             f"with every request (uploads are cached in {UPLOAD_CACHE_PATH})"
+    )
+    
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Classify every PDF again instead of reusing results of earlier runs with the same "
+             f"PDF content, model, temperature and prompt (cached in {RESULT_CACHE_PATH})"
+    )
+    
+    parser.add_argument(
+        "--yes", "-y",
+        action="store_true",
+        help="Start a full run without asking for confirmation (e.g., for scripted runs)"
+    )
+    
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -694,6 +1464,19 @@ def main():
     # Parse command-line arguments
     args = parse_arguments()
     
+    # Collect the results of an interrupted --batch run (no PDFs are scanned or submitted)
+    if args.collect_batch:
+        state_path = Path(args.collect_batch)
+        batch_state = load_batch_state(state_path)
+        print(f"\nCollecting batch results from: {state_path}")
+        results_df = collect_batch_results(state_path)
+        save_final_results(
+            df=results_df,
+            model=batch_state["model"],
+            test_mode=batch_state["test_mode"]
+        )
+        return
+    
     # Print banner
     print("\n" + "=" * 70)
     print("DeLFI Research Software Annotation")
@@ -702,6 +1485,10 @@ def main():
     print(f"Temperature: {args.temperature}")
     print(f"Test mode:   {args.test}" + (f" (sample size: {args.test_size})" if args.test else ""))
     print(f"Resume from: {args.resume if args.resume else 'None (fresh start)'}")
+    print(f"Workers:     {args.workers}")
+    print(f"Batch API:   {args.batch}")
+    print(f"Upload PDFs: {args.upload_files}")
+    print(f"Use cache:   {not args.no_cache}")
     print("=" * 70)
     
     # Get all relevant PDFs
@@ -714,9 +1501,7 @@ def main():
         print("\n[DRY RUN - No API calls will be made]\n")
         
         # Show distribution by year
-        year_counts = {}
-        for _, _, year in pdf_list:
-            year_counts[year] = year_counts.get(year, 0) + 1
+        year_counts = Counter(year for _, _, year in pdf_list)
         
         print(f"{'Year':<6} {'PDFs':<8}")
         print("-" * 20)
@@ -734,10 +1519,10 @@ def main():
         
         return
     
-    # Confirm before full run (not in test mode)
-    if not args.test and not args.resume:
+    # Confirm before full run (not in test mode, skipped with --yes)
+    if not args.test and not args.resume and not args.yes:
         print(f"\nAbout to process {len(pdf_list)} PDFs.")
-        print("Estimated time: ~2 hours")
+        print("Estimated time: up to 24 hours (Batch API)" if args.batch else "Estimated time: ~2 hours")
         response = input("\nProceed? [y/N]: ").strip().lower()
         if response != "y":
             print("Aborted.")
@@ -746,14 +1531,29 @@ def main():
     # Process PDFs
     checkpoint_path = Path(args.resume) if args.resume else None
     
-    results_df = process_pdfs(
-        pdf_list=pdf_list,
-        model=args.model,
-        temperature=args.temperature,
-        checkpoint_path=checkpoint_path,
-        test_mode=args.test,
-        test_sample_size=args.test_size
-    )
+    if args.batch:
+        results_df = process_pdfs_batch(
+            pdf_list=pdf_list,
+            model=args.model,
+            temperature=args.temperature,
+            checkpoint_path=checkpoint_path,
+            test_mode=args.test,
+            test_sample_size=args.test_size,
+            upload_files=args.upload_files,
+            use_cache=not args.no_cache
+        )
+    else:
+        results_df = process_pdfs(
+            pdf_list=pdf_list,
+            model=args.model,
+            temperature=args.temperature,
+            checkpoint_path=checkpoint_path,
+            test_mode=args.test,
+            test_sample_size=args.test_size,
+            max_workers=args.workers,
+            upload_files=args.upload_files,
+            use_cache=not args.no_cache
+        )
     
     # Save final results
     final_path = save_final_results(
@@ -1,5 +1,10 @@
+import os
 import pandas as pd
 import numpy as np
+
+# The script only saves the figure, so no GUI backend is needed
+# (setdefault keeps a backend chosen by the environment, e.g. inline in Jupyter)
+os.environ.setdefault("MPLBACKEND", "Agg")
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 from matplotlib.offsetbox import AnchoredText
@@ -7,15 +12,15 @@ import seaborn as sns
 
 
 
-# Load df with results 
+# Load df with results (only the columns used below; the justification texts make up most of the file)
 
-df = pd.read_csv("../df_gpt-4o-mini_2026-01-21_21-38.csv")
+df = pd.read_csv("../df_gpt-4o-mini_2026-01-21_21-38.csv", usecols=["year", "label_research_software"])
 print(df.shape)
 df.head()
 
 
 # Filter to successful annotations only
-df_valid = df[df["label_research_software"].notna()].copy()
+df_valid = df[df["label_research_software"].notna()]
 print(df_valid.shape)
 
 
@@ -30,11 +35,12 @@ df_valid["label_research_software"].describe()
 df_valid.groupby("year")["label_research_software"].mean()
 
 # Create a comprehensive dataframe
-df_valid_yearly_stats = df_valid.groupby("year").agg(
-    n_papers=("label_research_software", "count"),
-    mean_label=("label_research_software", "mean"),
-    std_label=("label_research_software", "std"),
-    sum_research_sw=("label_research_software", "sum")
+# (all statistics in one aggregation over the label column)
+df_valid_yearly_stats = df_valid.groupby("year")["label_research_software"].agg(
+    n_papers="count",
+    mean_label="mean",
+    std_label="std",
+    sum_research_sw="sum"
     ).round(2)
 
 df_valid_yearly_stats.head()
@@ -42,10 +48,11 @@ df_valid_yearly_stats.head()
 
 
 
-def add_annotation_box(fig, ax):
+def add_annotation_box(fig, ax, bar_color):
     """
     Option 1: Elegant box with subtle teal accent
     Uses fig.text() with custom bbox properties
+    (box colors are derived from bar_color)
     """
     annotation_text = (
         "Details of the Experiment (Binary Classification)\n"
@@ -56,9 +63,6 @@ def add_annotation_box(fig, ax):
         "Total Papers: n = 1,052"
     )
     
-    # Get the bar color for coordination
-    bar_color = sns.color_palette("husl", 9)[5]
-    
     # Create a lighter version for the box background
     box_bg_color = (*bar_color[:3], 0.08)  # Very light teal with low alpha
     box_edge_color = (*bar_color[:3], 0.6)  # Teal edge with medium alpha
@@ -97,9 +101,12 @@ fig, ax = plt.subplots(figsize=(14, 7))
 BAR_COLOR = sns.color_palette("husl", 9)[5]
 
 
+# Year labels for the x-axis (shared by bars and error bars)
+x_labels = df_plot["year"].astype(str).to_numpy()
+
 # Create bar plot
 bars = ax.bar(
-    x=df_plot["year"].astype(str),
+    x=x_labels,
     height=df_plot["mean_label"],
     color=BAR_COLOR,
     edgecolor="black",
@@ -118,7 +125,7 @@ for bar, n in zip(bars, df_plot["n_papers"]):
 
 # Add error bars
 ax.errorbar(
-    x=df_plot["year"].astype(str),
+    x=x_labels,
     y=df_plot["mean_label"],
     yerr=df_plot["std_label"],
     fmt="none",
@@ -137,7 +144,7 @@ ax.tick_params(axis='x', labelrotation=45)
 
 plt.tight_layout(rect=[0, 0.15, 1, 1])  # [left, bottom, right, top] - leaves 15% space at bottom
 
-add_annotation_box(fig, ax)  # Elegant teal accent
+add_annotation_box(fig, ax, BAR_COLOR)  # Elegant teal accent
 
 plt.savefig(
     "llm_annotation_barplot.png",